@@ -1,22 +1,46 @@
 from diskcache import Cache
 import os
+import copy
 import functools
 import hashlib
 import logging
+from collections import OrderedDict
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 cache = Cache(os.getenv("CACHE_DIR_PATH","cache") + "/azureOpenAICache")
 
-def async_diskcache(cacheName):
+def async_diskcache(cacheName, memory_cache_size:int=0):
+    """
+    Caches the results of an async function on disk. If memory_cache_size is
+    set, the most recently used results are also kept in memory, in front of
+    the disk cache. Like results loaded from disk, results served from memory
+    are copies, so callers may mutate them. Falsy results (e.g. None or an
+    empty list) are treated as failures and are not cached, so the call is
+    retried next time.
+    """
     def decorator(func):
+        memory_cache = OrderedDict()
+
+        def remember(cache_key, result):
+            if memory_cache_size > 0:
+                memory_cache[cache_key] = copy.deepcopy(result)
+                memory_cache.move_to_end(cache_key)
+                if len(memory_cache) > memory_cache_size:
+                    memory_cache.popitem(last=False)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             # Create a unique cache key
             cache_key = _key_function(cacheName,*args)
-            if cache_key in cache:
+            if cache_key in memory_cache:
+                memory_cache.move_to_end(cache_key)
+                return copy.deepcopy(memory_cache[cache_key])
+            cached_result = cache.get(cache_key)
+            if cached_result:
                 logging.info(f"Cache hit for {cacheName} with key {cache_key}")
-                return cache[cache_key]
+                remember(cache_key, cached_result)
+                return cached_result
             else:
                 logging.info(f"Cache miss for {cacheName} with key {cache_key}")
                 try:
@@ -26,9 +50,12 @@ def async_diskcache(cacheName):
                     # Do not cache the result, re-raise the exception
                     raise
                 else:
+                    if not result:
+                        return result
                     # Store the result in the cache
                     logging.info(f"Storing result in cache for {cacheName} with key {cache_key}")
                     cache[cache_key] = result
+                    remember(cache_key, result)
                     return result
         return wrapper
     return decorator
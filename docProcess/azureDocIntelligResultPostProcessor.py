@@ -1,10 +1,15 @@
+import asyncio
 import logging
+import os
 from collections import defaultdict
-from typing import Dict, List, Literal, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Literal, Optional, Set, Tuple, Union
 
 from azure.ai.documentintelligence.models import (
     AnalyzeResult,
+    DocumentBarcode,
     DocumentFigure,
+    DocumentFormula,
     DocumentKeyValuePair,
     DocumentLine,
     DocumentPage,
@@ -21,7 +26,6 @@ from PIL.Image import Image as PILImage
 from .docIntelligElementTools import (
     ProcessedDocIntelElementDocumentType,
     convert_element_heirarchy_to_incremental_numbering,
-    document_span_to_span_bounds,
     get_all_barcodes,
     get_all_formulas,
     get_element_heirarchy_mapper,
@@ -29,7 +33,8 @@ from .docIntelligElementTools import (
     get_processed_di_doc_type,
     order_element_info_list,
 )
-from .elementProcess.elementTools import is_span_in_span
+from .elementProcess.elementInfo import ElementInfo
+from .elementProcess.elementTools import SortedSpanIndex, is_span_in_span
 from .elementProcess.figureProcessor import (
     DefaultDocumentFigureProcessor,
     DocumentFigureProcessor,
@@ -69,6 +74,381 @@ from .elementProcess.wordProcessor import (
 )
 from .imageTools import TransformedImage
 
+# Number of worker processes used by `convert_pages_parallel`
+PAGE_PROCESS_MAX_WORKERS = int(
+    os.getenv("PAGE_PROCESS_MAX_WORKERS", str(os.cpu_count() or 1))
+)
+
+# Maximum number of figures converted concurrently by `process_analyze_result`.
+# Figure processors may call external services (e.g. an LLM for image
+# descriptions), so figure conversions run in the background and overlap with
+# the conversion of the rest of the document.
+FIGURE_CONVERSION_MAX_CONCURRENCY = int(
+    os.getenv("FIGURE_CONVERSION_MAX_CONCURRENCY", "32")
+)
+
+# Element types whose conversion only depends on the element itself, and which
+# can therefore be converted independently for each page
+PAGE_PARALLEL_ELEMENT_TYPES = (
+    DocumentParagraph,
+    DocumentLine,
+    DocumentWord,
+    DocumentKeyValuePair,
+)
+
+
+# Element types whose spans are used to skip the lower-priority elements
+# they contain
+PRIORITY_ELEMENT_TYPES = (
+    DocumentTable,
+    DocumentFigure,
+    *PAGE_PARALLEL_ELEMENT_TYPES,
+)
+
+
+class PagePriorityTracker:
+    """
+    Tracks the spans of all elements already processed on the current page, so
+    that lower-priority elements whose content is already contained in a
+    higher-priority element can be skipped (e.g. paragraphs, lines and words
+    that appear in a table or figure, or lines and words that were already part
+    of a paragraph).
+
+    These rules are shared by `process_analyze_result` and
+    `get_skipped_element_ids`, so both skip exactly the same elements.
+    """
+
+    def __init__(self):
+        self.current_page_info: Optional[ElementInfo] = None
+        # Each processed span, along with the element it belongs to
+        self._priority_spans: List[Tuple[DocumentSpan, ElementInfo]] = list()
+
+    def is_contained(self, element_info: ElementInfo) -> bool:
+        """
+        Returns whether the element is a type that can be skipped and any of
+        its spans is contained in a processed element.
+        """
+        return isinstance(element_info.element, PAGE_PARALLEL_ELEMENT_TYPES) and any(
+            is_span_in_span(element_span, processed_span)
+            for element_span in element_info.spans
+            for processed_span, _ in self._priority_spans
+        )
+
+    def get_containing_elements(self, element_info: ElementInfo) -> List[ElementInfo]:
+        """
+        Returns the processed elements that contain any of the spans of the
+        element.
+        """
+        containing_elements = dict()
+        for processed_span, processed_element_info in self._priority_spans:
+            if any(
+                is_span_in_span(element_span, processed_span)
+                for element_span in element_info.spans
+            ):
+                containing_elements[processed_element_info.element_id] = (
+                    processed_element_info
+                )
+        return list(containing_elements.values())
+
+    def is_new_page(self, element_info: ElementInfo) -> bool:
+        """Returns whether the element starts after the current page."""
+        return (
+            self.current_page_info is not None
+            and element_info.start_page_number
+            > self.current_page_info.start_page_number
+        )
+
+    def end_page(self):
+        """Removes all spans that end before the current page does."""
+        current_page_end = self.current_page_info.full_span_bounds.end
+        self._priority_spans = [
+            (span, processed_element_info)
+            for span, processed_element_info in self._priority_spans
+            if span.offset > current_page_end
+        ]
+
+    def add_element(self, element_info: ElementInfo):
+        """
+        Records a processed element. Pages set the current page, and the spans
+        of `PRIORITY_ELEMENT_TYPES` elements are kept so the elements they
+        contain are skipped.
+        """
+        if isinstance(element_info.element, DocumentPage):
+            self.current_page_info = element_info
+        elif isinstance(element_info.element, PRIORITY_ELEMENT_TYPES):
+            self._priority_spans.extend(
+                (span, element_info) for span in element_info.spans
+            )
+
+
+def get_skipped_element_ids(
+    ordered_element_info_list: List[ElementInfo],
+) -> Set[str]:
+    """
+    Returns the IDs of the paragraph, line, word and key value pair elements
+    whose content is contained in a higher-priority element, using the same
+    `PagePriorityTracker` rules as the main loop of `process_analyze_result`.
+    The main loop converts any element that has no precomputed output (e.g.
+    one contained in a table that failed to convert), so leaving these
+    elements out of `convert_pages_parallel` never changes the output.
+
+    :param ordered_element_info_list: All elements of the document, ordered by
+        `order_element_info_list`.
+    :type ordered_element_info_list: List[ElementInfo]
+    :return: The IDs of the elements that would be skipped.
+    :rtype: Set[str]
+    """
+    skipped_element_ids = set()
+    priority_tracker = PagePriorityTracker()
+    for element_info in ordered_element_info_list:
+        if priority_tracker.is_contained(element_info):
+            skipped_element_ids.add(element_info.element_id)
+            continue
+        if priority_tracker.is_new_page(element_info):
+            priority_tracker.end_page()
+        priority_tracker.add_element(element_info)
+    return skipped_element_ids
+
+
+def _convert_page_elements(
+    paragraph_processor: DocumentParagraphProcessor,
+    line_processor: DocumentLineProcessor,
+    word_processor: DocumentWordProcessor,
+    key_value_pair_processor: DocumentKeyValuePairProcessor,
+    selection_mark_formatter: SelectionMarkFormatter,
+    page_elements: List[Tuple[ElementInfo, Optional[tuple[int]]]],
+    page_formulas: List[DocumentFormula],
+    page_barcodes: List[DocumentBarcode],
+) -> Dict[str, Union[List[HaystackDocument], Exception]]:
+    """
+    Converts the paragraph, line, word and key value pair elements of a single
+    page. Exceptions are returned in place of the outputs so they can be
+    handled by the caller in document order.
+    """
+    span_index = SortedSpanIndex(page_formulas, page_barcodes)
+    # Group the page's elements by type so each processor converts its
+    # elements in a single batch call
+    elements_by_type: Dict[
+        type, List[Tuple[ElementInfo, Optional[tuple[int]]]]
+    ] = defaultdict(list)
+    for element_info, section_heirarchy in page_elements:
+        for element_type in PAGE_PARALLEL_ELEMENT_TYPES:
+            if isinstance(element_info.element, element_type):
+                elements_by_type[element_type].append(
+                    (element_info, section_heirarchy)
+                )
+                break
+    processor_methods = {
+        DocumentParagraph: (
+            paragraph_processor.convert_paragraphs,
+            paragraph_processor.convert_paragraph,
+        ),
+        DocumentLine: (line_processor.convert_lines, line_processor.convert_line),
+        DocumentWord: (word_processor.convert_words, word_processor.convert_word),
+        DocumentKeyValuePair: (
+            key_value_pair_processor.convert_kv_pairs,
+            key_value_pair_processor.convert_kv_pair,
+        ),
+    }
+    outputs: Dict[str, Union[List[HaystackDocument], Exception]] = dict()
+    for element_type, elements in elements_by_type.items():
+        convert_elements, convert_element = processor_methods[element_type]
+        try:
+            batch_outputs = convert_elements(
+                elements,
+                page_formulas,
+                page_barcodes,
+                selection_mark_formatter,
+                span_index=span_index,
+            )
+            for (element_info, _), element_outputs in zip(elements, batch_outputs):
+                outputs[element_info.element_id] = element_outputs
+        except Exception:
+            # Convert the elements one at a time to find which ones failed
+            for element_info, section_heirarchy in elements:
+                try:
+                    outputs[element_info.element_id] = convert_element(
+                        element_info,
+                        page_formulas,
+                        page_barcodes,
+                        selection_mark_formatter,
+                        section_heirarchy,
+                        span_index=span_index,
+                    )
+                except Exception as _e:
+                    outputs[element_info.element_id] = _e
+    return outputs
+
+
+# Processors used by `_convert_page_elements_in_worker`, set once per worker
+# process by `_init_page_worker` rather than sent with every page
+_page_worker_processors: Tuple = tuple()
+
+
+def _init_page_worker(*processors) -> None:
+    """Stores the processors used by the worker process."""
+    global _page_worker_processors
+    _page_worker_processors = processors
+
+
+def _convert_page_elements_in_worker(
+    page_elements: List[Tuple[ElementInfo, Optional[tuple[int]]]],
+    page_formulas: List[DocumentFormula],
+    page_barcodes: List[DocumentBarcode],
+) -> Dict[str, Union[List[HaystackDocument], Exception]]:
+    """Runs `_convert_page_elements` within a worker process."""
+    return _convert_page_elements(
+        *_page_worker_processors, page_elements, page_formulas, page_barcodes
+    )
+
+
+def create_page_process_pool(
+    paragraph_processor: DocumentParagraphProcessor,
+    line_processor: DocumentLineProcessor,
+    word_processor: DocumentWordProcessor,
+    key_value_pair_processor: DocumentKeyValuePairProcessor,
+    selection_mark_formatter: SelectionMarkFormatter,
+    max_workers: Optional[int] = None,
+) -> ProcessPoolExecutor:
+    """
+    Creates a process pool for `convert_pages_parallel`, with the processors
+    sent to each worker once when it starts. The pool can be reused for many
+    documents converted with the same processors, and must be shut down by
+    the caller.
+
+    :param paragraph_processor: Processor for paragraph elements.
+    :type paragraph_processor: DocumentParagraphProcessor
+    :param line_processor: Processor for line elements.
+    :type line_processor: DocumentLineProcessor
+    :param word_processor: Processor for word elements.
+    :type word_processor: DocumentWordProcessor
+    :param key_value_pair_processor: Processor for key value pair elements.
+    :type key_value_pair_processor: DocumentKeyValuePairProcessor
+    :param selection_mark_formatter: A formatter for selection marks.
+    :type selection_mark_formatter: SelectionMarkFormatter
+    :param max_workers: Number of worker processes. Defaults to the
+        PAGE_PROCESS_MAX_WORKERS environment variable, or the CPU count.
+    :type max_workers: int, optional
+    :return: The process pool.
+    :rtype: ProcessPoolExecutor
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or PAGE_PROCESS_MAX_WORKERS,
+        initializer=_init_page_worker,
+        initargs=(
+            paragraph_processor,
+            line_processor,
+            word_processor,
+            key_value_pair_processor,
+            selection_mark_formatter,
+        ),
+    )
+
+
+def convert_pages_parallel(
+    ordered_element_info_list: List[ElementInfo],
+    paragraph_processor: DocumentParagraphProcessor,
+    line_processor: DocumentLineProcessor,
+    word_processor: DocumentWordProcessor,
+    key_value_pair_processor: DocumentKeyValuePairProcessor,
+    selection_mark_formatter: SelectionMarkFormatter,
+    span_index: SortedSpanIndex,
+    max_workers: Optional[int] = None,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> Dict[str, Union[List[HaystackDocument], Exception]]:
+    """
+    Converts all paragraph, line, word and key value pair elements of a
+    document, with the elements of each page converted in a separate worker
+    process.
+
+    Elements that are skipped for being contained in a higher-priority
+    element (see `get_skipped_element_ids`) are not converted.
+
+    Without a `pool`, every call starts new worker processes and sends them
+    the processors, which can cost more than converting a short document.
+    When converting many documents, create one pool with
+    `create_page_process_pool` and pass it to every call instead.
+
+    :param ordered_element_info_list: All elements of the document, ordered by
+        `order_element_info_list`.
+    :type ordered_element_info_list: List[ElementInfo]
+    :param paragraph_processor: Processor for paragraph elements.
+    :type paragraph_processor: DocumentParagraphProcessor
+    :param line_processor: Processor for line elements.
+    :type line_processor: DocumentLineProcessor
+    :param word_processor: Processor for word elements.
+    :type word_processor: DocumentWordProcessor
+    :param key_value_pair_processor: Processor for key value pair elements.
+    :type key_value_pair_processor: DocumentKeyValuePairProcessor
+    :param selection_mark_formatter: A formatter for selection marks.
+    :type selection_mark_formatter: SelectionMarkFormatter
+    :param span_index: Index of all formulas and barcodes in the document.
+    :type span_index: SortedSpanIndex
+    :param max_workers: Number of worker processes, if `pool` is not given.
+        Defaults to the PAGE_PROCESS_MAX_WORKERS environment variable, or the
+        CPU count.
+    :type max_workers: int, optional
+    :param pool: A pool created by `create_page_process_pool` with the same
+        processors. If not given, a pool is created for this call only.
+    :type pool: ProcessPoolExecutor, optional
+    :return: A mapping of element ID to the converted outputs, or to the
+        exception raised while converting the element.
+    :rtype: Dict[str, Union[List[HaystackDocument], Exception]]
+    """
+    # Group elements by page, keeping the section each element falls under
+    page_elements: Dict[int, List[Tuple[ElementInfo, Optional[tuple[int]]]]] = (
+        defaultdict(list)
+    )
+    skipped_element_ids = get_skipped_element_ids(ordered_element_info_list)
+    current_section_heirarchy_incremental_id = None
+    for element_info in ordered_element_info_list:
+        if isinstance(element_info.element, DocumentSection):
+            current_section_heirarchy_incremental_id = (
+                element_info.section_heirarchy_incremental_id
+            )
+        elif (
+            isinstance(element_info.element, PAGE_PARALLEL_ELEMENT_TYPES)
+            and element_info.element_id not in skipped_element_ids
+        ):
+            page_elements[element_info.start_page_number].append(
+                (element_info, current_section_heirarchy_incremental_id)
+            )
+    # Only send each worker the formulas and barcodes within its page's elements
+    page_formulas = list()
+    page_barcodes = list()
+    for elements in page_elements.values():
+        min_offset = min(info.full_span_bounds.offset for info, _ in elements)
+        max_end = max(info.full_span_bounds.end for info, _ in elements)
+        page_span = DocumentSpan(offset=min_offset, length=max_end - min_offset)
+        page_formulas.append(span_index.get_formulas_in_spans([page_span]))
+        page_barcodes.append(span_index.get_barcodes_in_spans([page_span]))
+
+    outputs: Dict[str, Union[List[HaystackDocument], Exception]] = dict()
+    if not page_elements:
+        return outputs
+    own_pool = pool is None
+    if own_pool:
+        pool = create_page_process_pool(
+            paragraph_processor,
+            line_processor,
+            word_processor,
+            key_value_pair_processor,
+            selection_mark_formatter,
+            max_workers=max_workers,
+        )
+    try:
+        for page_outputs in pool.map(
+            _convert_page_elements_in_worker,
+            page_elements.values(),
+            page_formulas,
+            page_barcodes,
+        ):
+            outputs.update(page_outputs)
+    finally:
+        if own_pool:
+            pool.shutdown()
+    return outputs
+
 
 class DocumentIntelligenceResultPostProcessor:
      
@@ -99,6 +479,8 @@ class DocumentIntelligenceResultPostProcessor:
         doc_page_imgs: Optional[Dict[int, PILImage]] = None,
         on_error: Literal["ignore", "raise"] = "ignore",
         break_after_element_idx: Optional[int] = None,
+        convert_pages_in_parallel: bool = False,
+        page_process_pool: Optional[ProcessPoolExecutor] = None,
     ) -> List[HaystackDocument]:
         """
         Processes the result of a Document Intelligence analyze operation and
@@ -119,11 +501,26 @@ class DocumentIntelligenceResultPostProcessor:
         :type pdf_path: Union[str, os.PathLike], optional
         :param pdf_url: URL path to PDF, defaults to None
         :type pdf_url: str, optional
-        :param on_error: How to handle errors, defaults to "ignore"
+        :param on_error: How to handle errors, defaults to "ignore". With
+            "ignore", figures are converted concurrently with the rest of the
+            document, and the content of any figure that fails is converted
+            as if the figure did not exist. With "raise", figures are
+            converted in document order so an error stops processing at the
+            figure.
         :type on_error: Literal["ignore", "raise"], optional
         :param break_after_element_idx: If provided, this will break the
             processing loop after this many items. defaults to None
         :type break_after_element_idx: int, optional
+        :param convert_pages_in_parallel: If True, paragraph, line, word and
+            key value pair elements are converted upfront using a process pool
+            (see `convert_pages_parallel`). Processors must be picklable.
+            Defaults to False
+        :type convert_pages_in_parallel: bool, optional
+        :param page_process_pool: A pool created by `create_page_process_pool`
+            with this post-processor's processors, reused by
+            `convert_pages_parallel` instead of starting a new pool for this
+            document. defaults to None
+        :type page_process_pool: ProcessPoolExecutor, optional
         :returns: A list of Haystack Documents containing the processed content.
         :rtype: List[HaystackDocument]
         """
@@ -154,49 +551,94 @@ class DocumentIntelligenceResultPostProcessor:
 
         all_formulas = await get_all_formulas(analyze_result)
         all_barcodes = await get_all_barcodes(analyze_result)
+        # Index formulas and barcodes once so each element can look up its own
+        span_index = SortedSpanIndex(all_formulas, all_barcodes)
+
+        if convert_pages_in_parallel:
+            precomputed_outputs = await asyncio.to_thread(
+                convert_pages_parallel,
+                ordered_element_span_info_list,
+                self._paragraph_processor,
+                self._line_processor,
+                self._word_processor,
+                self._key_value_pair_processor,
+                self._selection_mark_formatter,
+                span_index,
+                pool=page_process_pool,
+            )
+        else:
+            precomputed_outputs = dict()
 
         # Create outputs
         full_output_list: List[HaystackDocument] = list()
 
         transformed_page_imgs: dict[TransformedImage] = dict()  # 1-based page numbers
-        current_page_info = None
+        if doc_page_imgs is not None:
+            # Export all page images concurrently. Any page that fails is exported
+            # again within the loop below so the error is handled with its element.
+            exported_page_imgs = await asyncio.gather(
+                *[
+                    self._page_processor.export_page_img(
+                        pdf_page_img=doc_page_imgs[page.page_number], di_page=page
+                    )
+                    for page in analyze_result.pages
+                ],
+                return_exceptions=True,
+            )
+            for page, exported_page_img in zip(
+                analyze_result.pages, exported_page_imgs
+            ):
+                if isinstance(exported_page_img, TransformedImage):
+                    transformed_page_imgs[page.page_number] = exported_page_img
+        # With on_error="ignore", figures are converted in background tasks. Each
+        # is recorded with the position in the output list its outputs should be
+        # inserted at and the index of the figure element.
+        figure_semaphore = asyncio.Semaphore(FIGURE_CONVERSION_MAX_CONCURRENCY)
+        pending_figures: List[Tuple[int, int, ElementInfo, asyncio.Task]] = list()
+        pending_figure_ids: Set[str] = set()
+        # Elements skipped only because they are contained in pending figures,
+        # with the position their outputs should be inserted at
+        figure_contained_elements: List[
+            Tuple[int, int, ElementInfo, Optional[tuple[int]], Set[str]]
+        ] = list()
+
+        async def convert_figure(*args) -> List[HaystackDocument]:
+            async with figure_semaphore:
+                return await self._figure_processor.convert_figure(*args)
+
         current_section_heirarchy_incremental_id = None
-        # Keep track of all spans already processed on the page. We will use this to
-        # skip low-priority elements that may already be contained in higher-priority
-        # elements (e.g. ignoring paragraphs/lines/words that already appear in a table
-        # or figure, or lines/words that were already part of a paragraph).
-        current_page_priority_spans: List[DocumentSpan] = list()
+        # Keep track of the current page and all spans already processed on it
+        priority_tracker = PagePriorityTracker()
         unprocessed_element_counter = defaultdict(int)
         # Work through all elements and add to output
         for element_idx, element_info in enumerate(ordered_element_span_info_list):
             try:
                 # Skip lower priority elements if their content is already processed as part of a higher-priority element
-                if any(
-                    isinstance(element_info.element, element_type)
-                    for element_type in [
-                        DocumentKeyValuePair,
-                        DocumentParagraph,
-                        DocumentLine,
-                        DocumentWord
-                    ]
-                ):
-                    span_already_processed = False
-                    for element_span in element_info.spans:
-                        spans_check = [
-                            await is_span_in_span(element_span, processed_span)
-                            for processed_span in current_page_priority_spans]
-                        
-                        if any(spans_check):
-                            span_already_processed = True
-                            break
-                    if span_already_processed:
-                        continue
+                if priority_tracker.is_contained(element_info):
+                    if pending_figures:
+                        containing_element_ids = {
+                            containing_element.element_id
+                            for containing_element in priority_tracker.get_containing_elements(
+                                element_info
+                            )
+                        }
+                        if containing_element_ids <= pending_figure_ids:
+                            # The element is only skipped because of figures that are
+                            # still being converted. If they all fail, the element is
+                            # converted in their place.
+                            figure_contained_elements.append(
+                                (
+                                    len(full_output_list),
+                                    element_idx,
+                                    element_info,
+                                    current_section_heirarchy_incremental_id,
+                                    containing_element_ids,
+                                )
+                            )
+                    continue
                 # Output page end outputs if the page has changed
-                if (
-                    current_page_info is not None
-                    and element_info.start_page_number
-                    > current_page_info.start_page_number
-                ):
+                if priority_tracker.is_new_page(element_info):
+                    current_page_info = priority_tracker.current_page_info
                     full_output_list.extend(
                         await self._page_processor.convert_page_end(
                             current_page_info,
@@ -206,12 +648,7 @@ class DocumentIntelligenceResultPostProcessor:
                             current_section_heirarchy_incremental_id,
                         )
                     )
-                    # Remove all spans that end before the current page does.
-                    current_page_priority_spans = [
-                        span
-                        for span in current_page_priority_spans
-                        if (await document_span_to_span_bounds(span)).offset > current_page_info.full_span_bounds.end
-                    ]
+                    priority_tracker.end_page()
                 ### Process new elements. The order of element types in this if/else loop matches
                 ### the ordering by `ordered_element_span_info_list` and should not be changed.
                 if isinstance(element_info.element, DocumentSection):
@@ -219,7 +656,7 @@ class DocumentIntelligenceResultPostProcessor:
                         element_info.section_heirarchy_incremental_id
                     )
                     full_output_list.extend(
-                        await self._section_processor.convert_section(
+                        self._section_processor.convert_section(
                             element_info, current_section_heirarchy_incremental_id
                         )
                     )
@@ -227,18 +664,19 @@ class DocumentIntelligenceResultPostProcessor:
                     continue
                 elif isinstance(element_info.element, DocumentPage):
                     # Export page image for use by this and other processors (e.g. page and figure processors)
-                    transformed_page_imgs[element_info.element.page_number] = (
-                        await self._page_processor.export_page_img(
-                            pdf_page_img=doc_page_imgs[element_info.element.page_number],
-                            di_page=element_info.element,
+                    if element_info.element.page_number not in transformed_page_imgs:
+                        transformed_page_imgs[element_info.element.page_number] = (
+                            await self._page_processor.export_page_img(
+                                pdf_page_img=doc_page_imgs[element_info.element.page_number],
+                                di_page=element_info.element,
+                            )
                         )
-                    )
-                    current_page_info = element_info
+                    priority_tracker.add_element(element_info)
                     full_output_list.extend(
                         await self._page_processor.convert_page_start(
                             element_info,
                             transformed_page_imgs[
-                                current_page_info.element.page_number
+                                element_info.element.page_number
                             ],
                             current_section_heirarchy_incremental_id,
                         )
@@ -247,81 +685,63 @@ class DocumentIntelligenceResultPostProcessor:
                 # Process high priority elements with text content
                 elif isinstance(element_info.element, DocumentTable):
                     full_output_list.extend(
-                        await self._table_processor.convert_table(
+                        self._table_processor.convert_table(
                             element_info,
                             all_formulas,
                             all_barcodes,
                             self._selection_mark_formatter,
                             current_section_heirarchy_incremental_id,
+                            span_index=span_index,
                         )
                     )
                 elif isinstance(element_info.element, DocumentFigure):
-                    full_output_list.extend(
-                        await self._figure_processor.convert_figure(
-                            element_info,
-                            transformed_page_imgs[element_info.start_page_number],
-                            analyze_result,
-                            all_formulas,
-                            all_barcodes,
-                            self._selection_mark_formatter,
-                            current_section_heirarchy_incremental_id,
-                        )
+                    figure_args = (
+                        element_info,
+                        transformed_page_imgs[element_info.start_page_number],
+                        analyze_result,
+                        all_formulas,
+                        all_barcodes,
+                        self._selection_mark_formatter,
+                        current_section_heirarchy_incremental_id,
                     )
+                    if on_error == "raise":
+                        # Convert the figure in place, so an error stops
+                        # processing at the figure
+                        full_output_list.extend(
+                            await self._figure_processor.convert_figure(*figure_args)
+                        )
+                    else:
+                        figure_task = asyncio.create_task(convert_figure(*figure_args))
+                        pending_figures.append(
+                            (len(full_output_list), element_idx, element_info, figure_task)
+                        )
+                        pending_figure_ids.add(element_info.element_id)
                 elif isinstance(
                     element_info.element, DocumentSelectionMark):
                     # Skip selection marks as these are processed by each individual processor
                     continue
-                elif isinstance(element_info.element, DocumentParagraph):
-                    full_output_list.extend(
-                        await self._paragraph_processor.convert_paragraph(
-                            element_info,
-                            all_formulas,
-                            all_barcodes,
-                            self._selection_mark_formatter,
-                            current_section_heirarchy_incremental_id,
-                        )
-                    )
-                elif isinstance(element_info.element, DocumentLine):
-                    full_output_list.extend(
-                        await self._line_processor.convert_line(
-                            element_info,
-                            all_formulas,
-                            all_barcodes,
-                            self._selection_mark_formatter,
-                            current_section_heirarchy_incremental_id,
-                        )
-                    )
-                elif isinstance(element_info.element, DocumentWord):
-                    full_output_list.extend(
-                        await self._word_processor.convert_word(
-                            element_info,
-                            all_formulas,
-                            all_barcodes,
-                            self._selection_mark_formatter,
-                            current_section_heirarchy_incremental_id,
-                        )
-                    )
-                elif isinstance(element_info.element, DocumentKeyValuePair):
+                elif isinstance(element_info.element, PAGE_PARALLEL_ELEMENT_TYPES):
                     full_output_list.extend(
-                        await self._key_value_pair_processor.convert_kv_pair(
+                        self._convert_text_element(
                             element_info,
                             all_formulas,
                             all_barcodes,
-                            self._selection_mark_formatter,
                             current_section_heirarchy_incremental_id,
+                            span_index,
+                            precomputed_outputs,
                         )
                     )
                 # elif isinstance(element.element, Document):
                 #     # TODO: Implement processor
                 else:
                     unprocessed_element_counter[
-                        element_info.element.__class__.__name__
+                        element_info.element_type_name
                     ] += 1
                     raise NotImplementedError(
-                        f"Processor for {element_info.element.__class__.__name__} is not supported."
+                        f"Processor for {element_info.element_type_name} is not supported."
                     )
                 # Save span start and end for the current element so we can skip lower-priority elements
-                current_page_priority_spans.extend(element_info.spans)
+                priority_tracker.add_element(element_info)
                 if (
                     break_after_element_idx is not None
                     and element_idx > break_after_element_idx
@@ -338,7 +758,60 @@ class DocumentIntelligenceResultPostProcessor:
                 )
                 if on_error == "raise":
                     raise
+        # Wait for all figure conversions, then insert their outputs at their
+        # positions in document order
+        figure_outputs = await asyncio.gather(
+            *[figure_task for _, _, _, figure_task in pending_figures],
+            return_exceptions=True,
+        )
+        insertions: List[Tuple[int, int, List[HaystackDocument]]] = list()
+        failed_figure_ids = set()
+        for (output_position, element_idx, element_info, _), element_outputs in zip(
+            pending_figures, figure_outputs
+        ):
+            if isinstance(element_outputs, BaseException):
+                print(
+                    f"Error processing element {element_info.element_id} (start_page_number: {element_info.start_page_number}).\nException: {element_outputs}\nElement info: {element_info}"
+                )
+                failed_figure_ids.add(element_info.element_id)
+            else:
+                insertions.append((output_position, element_idx, element_outputs))
+        # Convert the elements that were only skipped because of figures that
+        # failed, skipping any contained in another of these elements
+        fallback_tracker = PagePriorityTracker()
+        for (
+            output_position,
+            element_idx,
+            element_info,
+            section_heirarchy,
+            containing_figure_ids,
+        ) in figure_contained_elements:
+            if not containing_figure_ids <= failed_figure_ids:
+                continue
+            if fallback_tracker.is_contained(element_info):
+                continue
+            try:
+                element_outputs = self._convert_text_element(
+                    element_info,
+                    all_formulas,
+                    all_barcodes,
+                    section_heirarchy,
+                    span_index,
+                    precomputed_outputs,
+                )
+            except Exception as _e:
+                print(
+                    f"Error processing element {element_info.element_id} (start_page_number: {element_info.start_page_number}).\nException: {_e}\nElement info: {element_info}"
+                )
+                continue
+            fallback_tracker.add_element(element_info)
+            insertions.append((output_position, element_idx, element_outputs))
+        # Insert from the last position first so earlier positions stay valid.
+        # Outputs at the same position are inserted in document order.
+        for output_position, _, element_outputs in sorted(insertions, reverse=True):
+            full_output_list[output_position:output_position] = element_outputs
         # All content processed, add the final page output and the last chunk
+        current_page_info = priority_tracker.current_page_info
         if current_page_info is not None:
             full_output_list.extend(
                 await self._page_processor.convert_page_end(
@@ -353,6 +826,41 @@ class DocumentIntelligenceResultPostProcessor:
             )
         return full_output_list
 
+    def _convert_text_element(
+        self,
+        element_info: ElementInfo,
+        all_formulas: List[DocumentFormula],
+        all_barcodes: List[DocumentBarcode],
+        section_heirarchy: Optional[tuple[int]],
+        span_index: SortedSpanIndex,
+        precomputed_outputs: Dict[str, Union[List[HaystackDocument], Exception]],
+    ) -> List[HaystackDocument]:
+        """
+        Converts a paragraph, line, word or key value pair element, using its
+        output from `convert_pages_parallel` if it was already converted.
+        """
+        if element_info.element_id in precomputed_outputs:
+            element_outputs = precomputed_outputs[element_info.element_id]
+            if isinstance(element_outputs, Exception):
+                raise element_outputs
+            return element_outputs
+        if isinstance(element_info.element, DocumentParagraph):
+            convert_element = self._paragraph_processor.convert_paragraph
+        elif isinstance(element_info.element, DocumentLine):
+            convert_element = self._line_processor.convert_line
+        elif isinstance(element_info.element, DocumentWord):
+            convert_element = self._word_processor.convert_word
+        else:
+            convert_element = self._key_value_pair_processor.convert_kv_pair
+        return convert_element(
+            element_info,
+            all_formulas,
+            all_barcodes,
+            self._selection_mark_formatter,
+            section_heirarchy,
+            span_index=span_index,
+        )
+
     async def merge_adjacent_text_content_docs(
         self,
         chunk_content_list: Union[List[List[HaystackDocument]], List[HaystackDocument]],
@@ -22,8 +22,8 @@ from openai.types.chat.chat_completion_assistant_message_param import (
 from openai.types.chat.chat_completion_content_part_image_param import ImageURL
 from PIL.Image import Image as PILImage
 
-from prompt.systemPromptImageDescription import system_prompt_image_descripter
-from prompt.userPromptImageDescription import user_prompt_image_descriptor
+from prompt.systemPromptImageDescription import render_system_prompt_image_descripter
+from prompt.userPromptImageDescription import render_user_prompt_image_descriptor
 from roundRobin.azureOpenAIClientRoundRobin import client_manager
 
 from ..elementProcess.elementInfo import ElementInfo
@@ -69,7 +69,8 @@ class ImgeDescriptionByLlmFigureProcessor(DefaultDocumentFigureProcessor):
         :return: List of HaystackDocument objects containing the figure content.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
+        if self.strict:
+            self._validate_element_type(element_info)
         page_numbers = list(
             sorted(
                 {region.page_number for region in element_info.element.bounding_regions}
@@ -82,7 +83,7 @@ class ImgeDescriptionByLlmFigureProcessor(DefaultDocumentFigureProcessor):
         outputs: List[HaystackDocument] = list()
         meta = {
             "element_id": element_info.element_id,
-            "element_type": type(element_info.element).__name__,
+            "element_type": element_info.element_type_name,
             "page_number": element_info.start_page_number,
             "section_heirarchy": section_heirarchy,
         }
@@ -170,7 +171,7 @@ class ImgeDescriptionByLlmFigureProcessor(DefaultDocumentFigureProcessor):
 
         asyncAzureOpenclient = await client_manager.get_next_client()
         msg_content_list = list()
-        msg_content_list.append(ChatCompletionContentPartTextParam(type="text", text=user_prompt_image_descriptor.format(page_content=all_markdown_content,image_caption=cationText).content))
+        msg_content_list.append(ChatCompletionContentPartTextParam(type="text", text=render_user_prompt_image_descriptor(page_content=all_markdown_content,image_caption=cationText)))
         msg_content_list.append(ChatCompletionContentPartImageParam(
                     type="image_url",
                     image_url=ImageURL(url=pil_img_str_to_png_url(image),detail="auto")))
@@ -183,7 +184,7 @@ class ImgeDescriptionByLlmFigureProcessor(DefaultDocumentFigureProcessor):
             {
                 "role": "system",
 
-                "content": system_prompt_image_descripter.format(domain=domain).content
+                "content": render_system_prompt_image_descripter(domain=domain)
             },
             userMessageList
             ]
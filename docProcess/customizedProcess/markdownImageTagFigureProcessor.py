@@ -52,7 +52,8 @@ class MarkdownImageTagDocumentFigureProcessor(DefaultDocumentFigureProcessor):
         :return: List of HaystackDocument objects containing the figure content.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
+        if self.strict:
+            self._validate_element_type(element_info)
         page_numbers = list(
             sorted(
                 {region.page_number for region in element_info.element.bounding_regions}
@@ -65,7 +66,7 @@ class MarkdownImageTagDocumentFigureProcessor(DefaultDocumentFigureProcessor):
         outputs: List[HaystackDocument] = list()
         meta = {
             "element_id": element_info.element_id,
-            "element_type": type(element_info.element).__name__,
+            "element_type": element_info.element_type_name,
             "page_number": element_info.start_page_number,
             "section_heirarchy": section_heirarchy,
         }
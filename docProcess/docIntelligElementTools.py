@@ -228,9 +228,7 @@ async def get_element_span_info_list(
                     element=element,
                     full_span_bounds=full_span_bounds,
                     spans=spans,
-                    start_page_number=await page_span_calculator.determine_span_start_page(
-                        full_span_bounds.offset
-                    ),
+                    start_page_number=None,  # Set below for all elements at once
                     section_heirarchy_incremental_id=section_to_incremental_id_mapper.get(
                         attr, {}
                     ).get(
@@ -238,6 +236,13 @@ async def get_element_span_info_list(
                     ),
                 )
             )
+    start_page_numbers = page_span_calculator.determine_span_start_pages(
+        [element_info.full_span_bounds.offset for element_info in element_span_info_list]
+    )
+    for element_info, start_page_number in zip(
+        element_span_info_list, start_page_numbers.tolist()
+    ):
+        element_info.start_page_number = start_page_number
     page_sub_element_counter = defaultdict(int)
     for page_num, page in enumerate(analyze_result.pages):
         for attr in ["lines", "words", "selection_marks"]:
@@ -1,4 +1,5 @@
 
+import sys
 from dataclasses import dataclass
 from typing import List, Union
 
@@ -25,6 +26,8 @@ class SpanBounds:
     Dataclass representing the outer bounds of a span.
     """
 
+    __slots__ = ("offset", "end")
+
     offset: int
     end: int
 
@@ -39,6 +42,16 @@ class ElementInfo:
     Dataclass containing information about a document element.
     """
 
+    __slots__ = (
+        "element_id",
+        "element",
+        "full_span_bounds",
+        "spans",
+        "start_page_number",
+        "section_heirarchy_incremental_id",
+        "element_type_name",
+    )
+
     element_id: str
     element: Union[
         DocumentSection,
@@ -57,4 +70,10 @@ class ElementInfo:
     full_span_bounds: SpanBounds
     spans: List[DocumentSpan]
     start_page_number: int
-    section_heirarchy_incremental_id: tuple[int]
\ No newline at end of file
+    section_heirarchy_incremental_id: tuple[int]
+
+    def __post_init__(self):
+        # The element's type name is written to the metadata of its outputs,
+        # so it is resolved once here rather than by every processor. It is
+        # derived from `element`, so it is not a dataclass field.
+        self.element_type_name: str = sys.intern(type(self.element).__name__)
\ No newline at end of file
@@ -1,16 +1,43 @@
 from abc import ABC
-from typing import List
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from azure.ai.documentintelligence.models import DocumentBarcode, DocumentFormula
+from haystack.dataclasses import Document as HaystackDocument
 
 from .elementInfo import ElementInfo
+from .elementTools import SortedSpanIndex, compile_text_format
+from .selectionMarkFormatter import SelectionMarkFormatter
 
 
 class DocumentElementProcessor(ABC):
     """
     Base processor class for all Document elements extracted by Document
     Intelligence.
+
+    Each `convert_*` method validates that the element it is given is one of
+    the processor's `expected_elements`. Pipelines that already dispatch
+    elements by type can skip this check by passing `strict=False` to the
+    default processors, or by setting `strict = False` on the processor
+    instance.
     """
 
     expected_elements = []
+    strict: bool = True
+    _expected_element_types: FrozenSet[type] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Exact types are checked with a set lookup before falling back to
+        # isinstance, which is only needed for subclasses of expected types.
+        cls._expected_element_types = frozenset(cls.expected_elements)
 
     def _validate_element_type(self, element_info: ElementInfo):
         """
@@ -22,6 +49,8 @@ class DocumentElementProcessor(ABC):
         :raises ValueError: If the element of the ElementInfo object is not of
             the expected type.
         """
+        if type(element_info.element) in self._expected_element_types:
+            return
         if not self.expected_elements:
             raise ValueError("expected_element has not been set for this processor.")
 
@@ -33,6 +62,83 @@ class DocumentElementProcessor(ABC):
                 f"Element is incorrect type - {type(element_info.element)}. It should be one of `{self.expected_elements}` types."
             )
 
+    def _convert_elements(
+        self,
+        convert_element: Callable[..., List[HaystackDocument]],
+        elements: Sequence[Tuple[ElementInfo, Optional[tuple[int]]]],
+        all_formulas: List[DocumentFormula],
+        all_barcodes: List[DocumentBarcode],
+        selection_mark_formatter: SelectionMarkFormatter,
+        span_index: Optional[SortedSpanIndex] = None,
+    ) -> List[List[HaystackDocument]]:
+        """
+        Converts a batch of elements with a single-element `convert_*` method,
+        sharing one formula and barcode index across the whole batch.
+
+        :param convert_element: The single-element conversion method.
+        :type convert_element: Callable[..., List[HaystackDocument]]
+        :param elements: The elements to convert, each paired with its section
+            heirarchy.
+        :type elements: Sequence[Tuple[ElementInfo, Optional[tuple[int]]]]
+        :param all_formulas: List of all formulas extracted from the document.
+        :type all_formulas: List[DocumentFormula]
+        :param all_barcodes: A list of all barcodes extracted from the document.
+        :type all_barcodes: List[DocumentBarcode]
+        :param selection_mark_formatter: A formatter for selection marks.
+        :type selection_mark_formatter: SelectionMarkFormatter
+        :param span_index: An optional index of the document's formulas and
+            barcodes. If not provided, one is built for the batch.
+        :type span_index: SortedSpanIndex, optional
+        :return: The outputs of each element, in the same order as `elements`.
+        :rtype: List[List[HaystackDocument]]
+        """
+        if span_index is None:
+            span_index = SortedSpanIndex(all_formulas, all_barcodes)
+        return [
+            convert_element(
+                element_info,
+                all_formulas,
+                all_barcodes,
+                selection_mark_formatter,
+                section_heirarchy,
+                span_index=span_index,
+            )
+            for element_info, section_heirarchy in elements
+        ]
+
+    def _make_doc(
+        self,
+        element_info: ElementInfo,
+        content: str,
+        section_heirarchy: Optional[tuple[int]],
+        **extra_meta: Any,
+    ) -> HaystackDocument:
+        """
+        Creates the HaystackDocument for an element's text content, with the
+        standard metadata of the element.
+
+        :param element_info: Information about the Document element.
+        :type element_info: ElementInfo
+        :param content: Text content of the output document.
+        :type content: str
+        :param section_heirarchy: The section heirarchy of the element.
+        :type section_heirarchy: Optional[tuple[int]]
+        :param extra_meta: Any additional metadata to include.
+        :return: The output HaystackDocument.
+        :rtype: HaystackDocument
+        """
+        return HaystackDocument(
+            id=element_info.element_id,
+            content=content,
+            meta={
+                "element_id": element_info.element_id,
+                "element_type": element_info.element_type_name,
+                "page_number": element_info.start_page_number,
+                "section_heirarchy": section_heirarchy,
+                **extra_meta,
+            },
+        )
+
     def _format_str_contains_placeholders(
         self, format_str: str, expected_placeholders: List[str]
     ) -> bool:
@@ -46,4 +152,72 @@ class DocumentElementProcessor(ABC):
         :return: Whether the string contains any of the expected placeholders.
         :rtype: bool
         """
-        return any([placeholder in format_str for placeholder in expected_placeholders])
\ No newline at end of file
+        return any([placeholder in format_str for placeholder in expected_placeholders])
+
+    def _compile_content_text_format(
+        self,
+        text_format: str,
+        content_fields: Sequence[str],
+        other_fields: Sequence[str] = (),
+    ) -> Tuple[Callable[..., str], str, bool]:
+        """
+        Compiles the text format string of an element's text content, so the
+        format is parsed once rather than on every element conversion.
+
+        An element is not exported when its formatted text equals the null
+        output (the text rendered with every field empty). When all of the
+        content fields are inserted verbatim and none of the other fields are
+        used, the output is the null output exactly when every content field
+        is empty, so processors can check the content in place of comparing
+        the formatted text.
+
+        :param text_format: Text format string to compile.
+        :type text_format: str
+        :param content_fields: Names of the fields holding the element content.
+        :type content_fields: Sequence[str]
+        :param other_fields: Names of any other fields the format may use.
+        :type other_fields: Sequence[str], optional
+        :return: The formatter, the null output, and whether the content fields
+            alone decide if the output is the null output.
+        :rtype: Tuple[Callable[..., str], str, bool]
+        """
+        formatter = compile_text_format(text_format)
+        null_output = formatter(
+            **{field: "" for field in (*content_fields, *other_fields)}
+        )
+        field_names = formatter.field_names
+        content_decides_output = (
+            field_names is not None
+            and field_names.issuperset(content_fields)
+            and field_names.isdisjoint(other_fields)
+        )
+        return formatter, null_output, content_decides_output
+
+    def _compile_text_formats(
+        self, text_formats: Optional[List[str]], **null_kwargs
+    ) -> List[Tuple[Callable[..., str], str, bool]]:
+        """
+        Compiles a list of text format strings, precomputing everything about
+        each format that does not depend on the element being converted.
+
+        :param text_formats: Text format strings to compile.
+        :type text_formats: List[str], optional
+        :param null_kwargs: Empty values for every placeholder of the format
+            strings, used to render the output for an element with no content.
+        :return: A list of (formatter, null output, has placeholders) tuples,
+            one for each text format.
+        :rtype: List[Tuple[Callable[..., str], str, bool]]
+        """
+        compiled_formats = list()
+        for text_format in text_formats or []:
+            formatter = compile_text_format(text_format)
+            compiled_formats.append(
+                (
+                    formatter,
+                    formatter(**null_kwargs),
+                    self._format_str_contains_placeholders(
+                        text_format, self.expected_format_placeholders
+                    ),
+                )
+            )
+        return compiled_formats
\ No newline at end of file
@@ -1,5 +1,6 @@
-import re
-from typing import List
+import bisect
+import string
+from typing import Callable, List, Optional, TypeVar
 
 from azure.ai.documentintelligence.models import (
     DocumentBarcode,
@@ -13,10 +14,94 @@ from .elementInfo import ElementInfo, SpanBounds
 
 LATEX_NODES_TO_TEXT = LatexNodes2Text()
 
-async def get_element_number(element_info: ElementInfo) -> str:
-    return str(int(element_info.element_id.split("/")[-1]) + 1)
+SpanElement = TypeVar("SpanElement", DocumentFormula, DocumentBarcode)
 
-async def latex_to_text(latex_str: str) -> str:
+class CompiledTextFormat:
+    """
+    A text format string that has been parsed once, and can then be rendered
+    with keyword arguments, equivalent to `text_format.format(**kwargs)`.
+
+    A format made up of a single placeholder, such as the default
+    `"{content}"`, returns its string value directly without any formatting.
+    Formats that use positional fields, attribute/index lookups, conversions
+    or format specs fall back to `str.format`. Instances can be pickled, so
+    processors holding them can be sent to worker processes.
+
+    :param text_format: The text format string to compile.
+    :type text_format: str
+    """
+
+    __slots__ = ("text_format", "_segments", "_constant_text", "_identity_field")
+
+    def __init__(self, text_format: str):
+        self.text_format = text_format
+        self._segments = list()
+        self._constant_text = None
+        self._identity_field = None
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(
+            text_format
+        ):
+            if field_name is not None and (
+                format_spec or conversion or not field_name.isidentifier()
+            ):
+                self._segments = None
+                return
+            self._segments.append((literal, field_name))
+        if all(field_name is None for _, field_name in self._segments):
+            self._constant_text = "".join(literal for literal, _ in self._segments)
+        elif len(self._segments) == 1 and not self._segments[0][0]:
+            self._identity_field = self._segments[0][1]
+
+    def __call__(self, **kwargs) -> str:
+        if self._identity_field is not None:
+            value = kwargs[self._identity_field]
+            if type(value) is str:
+                return value
+        if self._constant_text is not None:
+            return self._constant_text
+        if self._segments is None:
+            return self.text_format.format(**kwargs)
+        return "".join(
+            [
+                literal if field_name is None else literal + format(kwargs[field_name])
+                for literal, field_name in self._segments
+            ]
+        )
+
+    @property
+    def field_names(self) -> Optional[frozenset]:
+        """
+        The names of the fields substituted verbatim into the output, or None
+        if the format falls back to `str.format`.
+        """
+        if self._segments is None:
+            return None
+        return frozenset(
+            field_name for _, field_name in self._segments if field_name is not None
+        )
+
+    def __getstate__(self):
+        return self.text_format
+
+    def __setstate__(self, text_format: str):
+        self.__init__(text_format)
+
+def compile_text_format(text_format: str) -> CompiledTextFormat:
+    """
+    Parses a text format string once and returns a callable that renders it
+    with keyword arguments, equivalent to `text_format.format(**kwargs)`.
+
+    :param text_format: The text format string to compile.
+    :type text_format: str
+    :return: A callable that renders the format with keyword arguments.
+    :rtype: CompiledTextFormat
+    """
+    return CompiledTextFormat(text_format)
+
+def get_element_number(element_info: ElementInfo) -> str:
+    return str(int(element_info.element_id.rpartition("/")[2]) + 1)
+
+def latex_to_text(latex_str: str) -> str:
     """
     Converts a string containing LaTeX to plain text.
 
@@ -27,7 +112,7 @@ async def latex_to_text(latex_str: str) -> str:
     """
     return LATEX_NODES_TO_TEXT.latex_to_text(latex_str).strip()
 
-async def is_span_in_span(
+def is_span_in_span(
     span: DocumentSpan,
     parent_span: DocumentSpan,
 ) -> bool:
@@ -45,7 +130,7 @@ async def is_span_in_span(
         parent_span.offset + parent_span.length
     )
 
-async def get_barcodes_in_spans(
+def get_barcodes_in_spans(
     all_barcodes: List[DocumentBarcode],
     spans: List[DocumentSpan],
 ) -> List[DocumentBarcode]:
@@ -62,11 +147,15 @@ async def get_barcodes_in_spans(
     matching_barcodes = list()
     for span in spans:
         matching_barcodes.extend(
-            [barcode for barcode in all_barcodes if is_span_in_span(barcode.span, span)]
+            [
+                barcode
+                for barcode in all_barcodes
+                if is_span_in_span(barcode.span, span)
+            ]
         )
     return matching_barcodes
 
-async def substitute_content_formulas(
+def substitute_content_formulas(
     content: str, matching_formulas: list[DocumentFormula]
 ) -> str:
     """
@@ -79,29 +168,21 @@ async def substitute_content_formulas(
     :returns: The content with the formulas substituted.
     :rtype: str
     """
-    # Get all string indices of :formula: in the content
-    match_bounds = [
-        (match.start(), match.end()) for match in re.finditer(r":formula:", content)
-    ]
-    if not len(match_bounds) == len(matching_formulas):
+    # Split around each :formula: placeholder and splice the formula values
+    # between the parts. Regex may throw issues with certain characters (e.g.
+    # double backslashes) in the replacement, so this is done manually.
+    content_parts = content.split(":formula:")
+    if not len(content_parts) - 1 == len(matching_formulas):
         raise ValueError(
             "The number of formulas to substitute does not match the number of :formula: placeholders in the content."
         )
-    # Regex may throw issues with certain characters (e.g. double backslashes), so do the replacement manually
-    new_content = ""
-    last_idx = 0
-    for match_bounds, matching_formula in zip(match_bounds, matching_formulas):
-        if match_bounds[0] == last_idx:
-            new_content += latex_to_text(matching_formula.value)
-            last_idx = match_bounds[1]
-        else:
-            new_content += content[last_idx : match_bounds[0]]
-            new_content += latex_to_text(matching_formula.value)
-            last_idx = match_bounds[1]
-    new_content += content[last_idx:]
-    return new_content
+    new_content_parts = [content_parts[0]]
+    for matching_formula, content_part in zip(matching_formulas, content_parts[1:]):
+        new_content_parts.append(latex_to_text(matching_formula.value))
+        new_content_parts.append(content_part)
+    return "".join(new_content_parts)
 
-async def substitute_content_barcodes(
+def substitute_content_barcodes(
     content: str, matching_barcodes: list[DocumentBarcode]
 ) -> str:
     """
@@ -114,34 +195,28 @@ async def substitute_content_barcodes(
     :returns: The content with the barcodes substituted.
     :rtype: str
     """
-    # Get all string indices of :barcode: in the content
-    match_bounds = [
-        (match.start(), match.end()) for match in re.finditer(r":barcode:", content)
-    ]
-    if not len(match_bounds) == len(matching_barcodes):
+    # Split around each :barcode: placeholder and splice the barcode values
+    # between the parts. Regex may throw issues with certain characters (e.g.
+    # double backslashes) in the replacement, so this is done manually.
+    content_parts = content.split(":barcode:")
+    if not len(content_parts) - 1 == len(matching_barcodes):
         raise ValueError(
             "The number of barcodes to substitute does not match the number of :barcode: placeholders in the content."
         )
-    # Regex may throw issues with certain characters (e.g. double backslashes), so do the replacement manually
-    new_content = ""
-    last_idx = 0
-    for match_bounds, matching_barcode in zip(match_bounds, matching_barcodes):
+    new_content_parts = [content_parts[0]]
+    for matching_barcode, content_part in zip(matching_barcodes, content_parts[1:]):
         kind_str = (
             matching_barcode.kind.value
             if isinstance(matching_barcode.kind, DocumentBarcodeKind)
             else matching_barcode.kind
         )
-        if match_bounds[0] == last_idx:
-            new_content += f"*Barcode value:* {matching_barcode.value} (*Barcode kind:* {kind_str})"
-            last_idx = match_bounds[1]
-        else:
-            new_content += content[last_idx : match_bounds[0]]
-            new_content += f"*Barcode value:* {matching_barcode.value} (*Barcode kind:* {kind_str})"
-            last_idx = match_bounds[1]
-    new_content += content[last_idx:]
-    return new_content
+        new_content_parts.append(
+            f"*Barcode value:* {matching_barcode.value} (*Barcode kind:* {kind_str})"
+        )
+        new_content_parts.append(content_part)
+    return "".join(new_content_parts)
 
-async def get_formulas_in_spans(
+def get_formulas_in_spans(
     all_formulas: List[DocumentFormula],
     spans: List[DocumentSpan],
 ) -> List[DocumentFormula]:
@@ -158,15 +233,106 @@ async def get_formulas_in_spans(
     matching_formulas = list()
     for span in spans:
         matching_formulas.extend(
-            [formula for formula in all_formulas if is_span_in_span(formula.span, span)]
+            [
+                formula
+                for formula in all_formulas
+                if is_span_in_span(formula.span, span)
+            ]
         )
     return matching_formulas
 
-async def replace_content_formulas_and_barcodes(
+def _get_sorted_elements_in_spans(
+    sorted_elements: List[SpanElement],
+    sorted_offsets: List[int],
+    spans: List[DocumentSpan],
+) -> List[SpanElement]:
+    """
+    Get all elements contained within a list of given spans, using a binary
+    search over the elements' span offsets.
+
+    :param sorted_elements: Elements sorted by their span offset.
+    :type sorted_elements: List[Union[DocumentFormula, DocumentBarcode]]
+    :param sorted_offsets: The span offsets of `sorted_elements`, in the same
+        order.
+    :type sorted_offsets: List[int]
+    :param spans: The spans to match.
+    :type spans: List[DocumentSpan]
+    :return: The elements contained within the given spans.
+    :rtype: List[Union[DocumentFormula, DocumentBarcode]]
+    """
+    matching_elements = list()
+    for span in spans:
+        span_end = span.offset + span.length
+        start_idx = bisect.bisect_left(sorted_offsets, span.offset)
+        end_idx = bisect.bisect_right(sorted_offsets, span_end)
+        matching_elements.extend(
+            [
+                element
+                for element in sorted_elements[start_idx:end_idx]
+                if element.span.offset + element.span.length <= span_end
+            ]
+        )
+    return matching_elements
+
+class SortedSpanIndex:
+    """
+    An index of all formulas and barcodes in a document, sorted by span offset.
+    Building this once per document allows the formulas and barcodes contained
+    by an element to be found with a binary search, rather than by checking
+    every formula and barcode in the document for each element.
+
+    :param all_formulas: A list of all formulas in the document.
+    :type all_formulas: List[DocumentFormula]
+    :param all_barcodes: A list of all barcodes in the document.
+    :type all_barcodes: List[DocumentBarcode]
+    """
+
+    def __init__(
+        self,
+        all_formulas: List[DocumentFormula],
+        all_barcodes: List[DocumentBarcode],
+    ):
+        self._formulas = sorted(all_formulas, key=lambda formula: formula.span.offset)
+        self._formula_offsets = [formula.span.offset for formula in self._formulas]
+        self._barcodes = sorted(all_barcodes, key=lambda barcode: barcode.span.offset)
+        self._barcode_offsets = [barcode.span.offset for barcode in self._barcodes]
+
+    def get_formulas_in_spans(
+        self, spans: List[DocumentSpan]
+    ) -> List[DocumentFormula]:
+        """
+        Get all formulas contained within a list of given spans.
+
+        :param spans: The spans to match.
+        :type spans: List[DocumentSpan]
+        :return: The formulas contained within the given spans.
+        :rtype: List[DocumentFormula]
+        """
+        return _get_sorted_elements_in_spans(
+            self._formulas, self._formula_offsets, spans
+        )
+
+    def get_barcodes_in_spans(
+        self, spans: List[DocumentSpan]
+    ) -> List[DocumentBarcode]:
+        """
+        Get all barcodes contained within a list of given spans.
+
+        :param spans: The spans to match.
+        :type spans: List[DocumentSpan]
+        :return: The barcodes contained within the given spans.
+        :rtype: List[DocumentBarcode]
+        """
+        return _get_sorted_elements_in_spans(
+            self._barcodes, self._barcode_offsets, spans
+        )
+
+def replace_content_formulas_and_barcodes(
     content: str,
     content_spans: List[DocumentSpan],
     all_formulas: List[DocumentFormula],
     all_barcodes: List[DocumentBarcode],
+    span_index: Optional[SortedSpanIndex] = None,
 ) -> str:
     """
     Replace formulas in the content with their actual values.
@@ -179,15 +345,25 @@ async def replace_content_formulas_and_barcodes(
     :type all_formulas: List[DocumentFormula]
     :param all_barcodes: A list of all barcodes in the document.
     :type all_barcodes: List[DocumentBarcode]
+    :param span_index: An optional index of `all_formulas` and `all_barcodes`.
+        If provided, it is used to find the matching formulas and barcodes
+        instead of scanning both lists.
+    :type span_index: SortedSpanIndex, optional
     :returns: The content with the formulas and barcdoes replaced.
     :rtype: str
     """
     if ":formula:" in content:
-        matching_formulas = await get_formulas_in_spans(all_formulas, content_spans)
-        content = await substitute_content_formulas(content, matching_formulas)
+        if span_index is not None:
+            matching_formulas = span_index.get_formulas_in_spans(content_spans)
+        else:
+            matching_formulas = get_formulas_in_spans(all_formulas, content_spans)
+        content = substitute_content_formulas(content, matching_formulas)
     if ":barcode:" in content:
-        matching_barcodes = await get_barcodes_in_spans(all_barcodes, content_spans)
-        content = await substitute_content_barcodes(content, matching_barcodes)
+        if span_index is not None:
+            matching_barcodes = span_index.get_barcodes_in_spans(content_spans)
+        else:
+            matching_barcodes = get_barcodes_in_spans(all_barcodes, content_spans)
+        content = substitute_content_barcodes(content, matching_barcodes)
     return content
 
 def get_min_and_max_span_bounds(
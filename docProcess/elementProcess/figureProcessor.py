@@ -98,6 +98,9 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
         image itself. If None, no text content will be extracted after the
         image.
     :type after_figure_text_formats: List[str], optional
+    :param strict: Whether to validate the type of each element before
+        converting it, defaults to True.
+    :type strict: bool, optional
     """
 
     expected_format_placeholders = [
@@ -118,8 +121,10 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
         output_figure_img: bool = True,
         figure_img_text_format: Optional[str] = "\n*Figure Image:*",
         after_figure_text_formats: Optional[List[str]] = None,
-        markdown_img_tag_path_or_url:Optional[str] = None
+        markdown_img_tag_path_or_url:Optional[str] = None,
+        strict: bool = True,
     ):
+        self.strict = strict
         self.before_figure_text_formats = before_figure_text_formats
         self.output_figure_img = output_figure_img
         self.figure_img_text_format = figure_img_text_format
@@ -158,7 +163,8 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
         :return: List of HaystackDocument objects containing the figure content.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
+        if self.strict:
+            self._validate_element_type(element_info)
         page_numbers = list(
             sorted(
                 {region.page_number for region in element_info.element.bounding_regions}
@@ -171,7 +177,7 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
         outputs: List[HaystackDocument] = list()
         meta = {
             "element_id": element_info.element_id,
-            "element_type": type(element_info.element).__name__,
+            "element_type": element_info.element_type_name,
             "page_number": element_info.start_page_number,
             "section_heirarchy": section_heirarchy,
         }
@@ -240,8 +246,8 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
                                       selection_mark_formatter: SelectionMarkFormatter,
                                       all_formulas: List[DocumentFormula],
                                       all_barcodes: List[DocumentBarcode],):
-        return await selection_mark_formatter.format_content(
-            await replace_content_formulas_and_barcodes(
+        return selection_mark_formatter.format_content(
+            replace_content_formulas_and_barcodes(
                 element_info.element.caption.content,
                 element_info.element.caption.spans,
                 all_formulas,
@@ -285,9 +291,9 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
         :return: List of HaystackDocument objects containing the text content.
         :rtype: List[HaystackDocument]
         """
-        figure_number_text = await get_element_number(element_info)
-        caption_text = await selection_mark_formatter.format_content(
-            await replace_content_formulas_and_barcodes(
+        figure_number_text = get_element_number(element_info)
+        caption_text = selection_mark_formatter.format_content(
+            replace_content_formulas_and_barcodes(
                 element_info.element.caption.content,
                 element_info.element.caption.spans,
                 all_formulas,
@@ -297,10 +303,10 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
             else ""
         )
         if element_info.element.footnotes:
-            footnotes_text = await selection_mark_formatter.format_content(
+            footnotes_text = selection_mark_formatter.format_content(
                 "\n".join(
                     [
-                        await replace_content_formulas_and_barcodes(
+                        replace_content_formulas_and_barcodes(
                             footnote.content, footnote.spans, all_formulas, all_barcodes
                         )
                         for footnote in element_info.element.footnotes
@@ -310,7 +316,7 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
         else:
             footnotes_text = ""
         # Get text content only if it is necessary (it is a slow operation)
-        content_text = await selection_mark_formatter.format_content(
+        content_text = selection_mark_formatter.format_content(
             await self._get_figure_text_content(
                 element_info.element,
                 analyze_result,
@@ -375,15 +381,18 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
         """
         # Identify figure content spans
         caption_spans = figure_element.caption.spans if figure_element.caption else []
-        footnote_spans = list(
-            itertools.chain.from_iterable(
-                [footnote.spans for footnote in figure_element.footnotes or []]
-            )
+        footnote_spans = itertools.chain.from_iterable(
+            [footnote.spans for footnote in figure_element.footnotes or []]
         )
+        # Key excluded spans by (offset, length) so each lookup is a set hit
+        excluded_span_keys = {
+            (span.offset, span.length)
+            for span in itertools.chain(caption_spans, footnote_spans)
+        }
         content_spans = [
             span
             for span in figure_element.spans
-            if span not in caption_spans and span not in footnote_spans
+            if (span.offset, span.length) not in excluded_span_keys
         ]
         figure_page_numbers = [
             region.page_number for region in figure_element.bounding_regions
@@ -403,7 +412,7 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
                 span_perfect_match = para.spans[0] == content_span
                 span_perfect_match = False
                 span_checks = [
-                    await is_span_in_span(para_span, content_span)
+                    is_span_in_span(para_span, content_span)
                     for para_span in para.spans
                 ]
                 if span_perfect_match or all(span_checks):
@@ -412,8 +421,8 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
                         output_line_strings.append(" ".join(current_line_strings))
                         current_line_strings = list()
                     output_line_strings.append(
-                        await selection_mark_formatter.format_content(
-                            await replace_content_formulas_and_barcodes(
+                        selection_mark_formatter.format_content(
+                            replace_content_formulas_and_barcodes(
                                 para.content, para.spans, all_formulas, all_barcodes
                             )
                         )
@@ -429,13 +438,13 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
                     check_list = []
                     for matched_span in matched_spans:
                         for line_span in line.spans:
-                            check_list.append(await is_span_in_span(line_span, matched_span))
+                            check_list.append(is_span_in_span(line_span, matched_span))
                     if any(check_list):
                         continue
                     
                     span_perfect_match = line.spans[0] == content_span
                     span_checks = [
-                        await is_span_in_span(line_span, content_span)
+                        is_span_in_span(line_span, content_span)
                         for line_span in line.spans
                     ]
                     if span_perfect_match or all(span_checks):
@@ -444,8 +453,8 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
                             output_line_strings.append(" ".join(current_line_strings))
                             current_line_strings = list()
                         output_line_strings.append(
-                            await selection_mark_formatter.format_content(
-                                await replace_content_formulas_and_barcodes(
+                            selection_mark_formatter.format_content(
+                                replace_content_formulas_and_barcodes(
                                     line.content, line.spans, all_formulas, all_barcodes
                                 )
                             )
@@ -458,16 +467,16 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
                         break
                     # If line is already part of a higher-priority element, skip it
                     span_checks = [
-                        await is_span_in_span(word.span, matched_span)
+                        is_span_in_span(word.span, matched_span)
                         for matched_span in matched_spans
                     ]
                     if any(span_checks):
                         continue
                     span_perfect_match = word.span == content_span
-                    if span_perfect_match or (await is_span_in_span(word.span, content_span)):
+                    if span_perfect_match or is_span_in_span(word.span, content_span):
                         current_line_strings.append(
-                            await selection_mark_formatter.format_content(
-                                await replace_content_formulas_and_barcodes(
+                            selection_mark_formatter.format_content(
+                                replace_content_formulas_and_barcodes(
                                     word.content,
                                     [word.span],
                                     all_formulas,
@@ -535,6 +544,8 @@ class DefaultDocumentFigureProcessor(DocumentFigureProcessor):
                 transformed_page_img.orig_image.width,
                 transformed_page_img.orig_image.height,
             )
+        # Crop the PIL page image directly, which keeps the page's mode and
+        # palette and holds no extra copy of the page in memory
         return crop_img(
             transformed_page_img.image,
             pixel_polygon,
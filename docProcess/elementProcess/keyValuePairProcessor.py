@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from azure.ai.documentintelligence.models import (
     DocumentBarcode,
@@ -10,7 +10,10 @@ from haystack.dataclasses import Document as HaystackDocument
 
 from .elementInfo import ElementInfo
 from .elementProcessor import DocumentElementProcessor
-from .elementTools import replace_content_formulas_and_barcodes
+from .elementTools import (
+    SortedSpanIndex,
+    replace_content_formulas_and_barcodes,
+)
 from .selectionMarkFormatter import SelectionMarkFormatter
 
 
@@ -22,18 +25,39 @@ class DocumentKeyValuePairProcessor(DocumentElementProcessor):
     expected_elements = [DocumentKeyValuePair]
 
     @abstractmethod
-    async def convert_kv_pair(
+    def convert_kv_pair(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Method for exporting Key Value pairs.
         """
 
+    def convert_kv_pairs(
+        self,
+        elements: Sequence[Tuple[ElementInfo, Optional[tuple[int]]]],
+        all_formulas: List[DocumentFormula],
+        all_barcodes: List[DocumentBarcode],
+        selection_mark_formatter: SelectionMarkFormatter,
+        span_index: Optional[SortedSpanIndex] = None,
+    ) -> List[List[HaystackDocument]]:
+        """
+        Converts a batch of key value pair elements with `convert_kv_pair`.
+        """
+        return self._convert_elements(
+            self.convert_kv_pair,
+            elements,
+            all_formulas,
+            all_barcodes,
+            selection_mark_formatter,
+            span_index=span_index,
+        )
+
 
 class DefaultDocumentKeyValuePairProcessor(DocumentKeyValuePairProcessor):
     """
@@ -47,6 +71,9 @@ class DefaultDocumentKeyValuePairProcessor(DocumentKeyValuePairProcessor):
 
     :param text_format: Text format string for text content.
     :type text_format: str, optional
+    :param strict: Whether to validate the type of each element before
+        converting it, defaults to True.
+    :type strict: bool, optional
     """
 
     expected_format_placeholders = ["{key_content}", "{value_content}"]
@@ -54,16 +81,27 @@ class DefaultDocumentKeyValuePairProcessor(DocumentKeyValuePairProcessor):
     def __init__(
         self,
         text_format: Optional[str] = "*Key Value Pair*: {key_content}: {value_content}",
+        strict: bool = True,
     ):
+        self.strict = strict
         self.text_format = text_format
+        if text_format:
+            (
+                self._text_formatter,
+                self._null_output,
+                self._content_decides_output,
+            ) = self._compile_content_text_format(
+                text_format, ("key_content", "value_content")
+            )
 
-    async def convert_kv_pair(
+    def convert_kv_pair(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Converts a DocumentKeyValuePair element into a Haystack Document object
@@ -79,42 +117,42 @@ class DefaultDocumentKeyValuePairProcessor(DocumentKeyValuePairProcessor):
         :type selection_mark_formatter: SelectionMarkFormatter
         :param section_heirarchy: The section heirarchy of the word.
         :type section_heirarchy: Optional[tuple[int]]
+        :param span_index: An optional index of the document's formulas and
+            barcodes, used to speed up formula and barcode substitution.
+        :type span_index: SortedSpanIndex, optional
         :return: A list of Haystack Documents containing the KV pair content.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
-        key_content = await replace_content_formulas_and_barcodes(
+        if self.strict:
+            self._validate_element_type(element_info)
+        # Pairs with an empty key and value always render to the null output
+        if not self.text_format or (
+            not element_info.element.key.content
+            and not element_info.element.value.content
+        ):
+            return list()
+        key_content = replace_content_formulas_and_barcodes(
             element_info.element.key.content,
             element_info.element.key.spans,
             all_formulas,
             all_barcodes,
+            span_index=span_index,
         )
-        key_content = await selection_mark_formatter.format_content(key_content)
-        value_content = await replace_content_formulas_and_barcodes(
+        key_content = selection_mark_formatter.format_content(key_content)
+        value_content = replace_content_formulas_and_barcodes(
             element_info.element.value.content,
             element_info.element.value.spans,
             all_formulas,
             all_barcodes,
+            span_index=span_index,
         )
-        value_content = await selection_mark_formatter.format_content(value_content)
-        if self.text_format:
-            formatted_text = self.text_format.format(
-                key_content=key_content, value_content=value_content
-            )
-            formatted_if_null = self.text_format.format(
-                key_content="", value_content=""
-            )
-            if formatted_text != formatted_if_null:
-                return [
-                    HaystackDocument(
-                        id=f"{element_info.element_id}",
-                        content=formatted_text,
-                        meta={
-                            "element_id": element_info.element_id,
-                            "element_type": type(element_info.element).__name__,
-                            "page_number": element_info.start_page_number,
-                            "section_heirarchy": section_heirarchy,
-                        },
-                    )
-                ]
-        return list()
\ No newline at end of file
+        value_content = selection_mark_formatter.format_content(value_content)
+        formatted_text = self._text_formatter(
+            key_content=key_content, value_content=value_content
+        )
+        if self._content_decides_output:
+            if not key_content and not value_content:
+                return list()
+        elif formatted_text == self._null_output:
+            return list()
+        return [self._make_doc(element_info, formatted_text, section_heirarchy)]
\ No newline at end of file
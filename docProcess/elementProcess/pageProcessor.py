@@ -1,15 +1,23 @@
+import asyncio
+import sys
 from abc import abstractmethod
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
 
 from azure.ai.documentintelligence.models import AnalyzeResult, Document, DocumentPage
 from haystack.dataclasses import ByteStream as HaystackByteStream
 from haystack.dataclasses import Document as HaystackDocument
 from PIL.Image import Image as PILImage
 
-from ..imageTools import TransformedImage, pil_img_to_base64, rotate_img_pil
+from ..imageTools import TransformedImage, rotate_img_pil
 from .elementInfo import ElementInfo, SpanBounds
 from .elementProcessor import DocumentElementProcessor
-from .elementTools import get_min_and_max_span_bounds
+from .elementTools import compile_text_format
+
+# Page location values shared by the metadata of every page output
+_PAGE_LOC_START = sys.intern("start")
+_PAGE_LOC_END = sys.intern("end")
 
 
 class DocumentPageProcessor(DocumentElementProcessor):
@@ -82,6 +90,18 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         image is rotated and new pixels are added to the image, defaults to
         (255, 255, 255)
     :type rotated_fill_color: Tuple[int], optional
+    :param jpeg_quality: JPEG quality of the exported page image, defaults to
+        75
+    :type jpeg_quality: int, optional
+    :param color_mode: Color mode of the exported page image. Use "L" to export
+        grayscale images, defaults to "RGB"
+    :type color_mode: Literal["RGB", "L"], optional
+    :param max_dim: If provided, exported page images are downsized so that
+        neither side exceeds this many pixels, defaults to None
+    :type max_dim: int, optional
+    :param strict: Whether to validate the type of each element before
+        converting it, defaults to True.
+    :type strict: bool, optional
     """
 
     expected_format_placeholders = ["{page_number}"]
@@ -97,7 +117,12 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         img_export_dpi: int = 100,
         adjust_rotation: bool = True,
         rotated_fill_color: Tuple[int] = (255, 255, 255),
+        jpeg_quality: int = 75,
+        color_mode: Literal["RGB", "L"] = "RGB",
+        max_dim: Optional[int] = None,
+        strict: bool = True,
     ):
+        self.strict = strict
         self.page_start_text_formats = page_start_text_formats
         self.page_end_text_formats = page_end_text_formats
         self.page_img_order = page_img_order
@@ -105,6 +130,19 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         self.img_export_dpi = img_export_dpi
         self.adjust_rotation = adjust_rotation
         self.rotated_fill_color = rotated_fill_color
+        self.jpeg_quality = jpeg_quality
+        self.color_mode = color_mode
+        self.max_dim = max_dim
+        # Parse the formats once rather than on every page
+        self._page_img_text_intro_formatter = (
+            compile_text_format(page_img_text_intro) if page_img_text_intro else None
+        )
+        self._page_start_compiled_formats = self._compile_text_formats(
+            page_start_text_formats, page_number=""
+        )
+        self._page_end_compiled_formats = self._compile_text_formats(
+            page_end_text_formats, page_number=""
+        )
 
     async def export_page_img(
         self, pdf_page_img: PILImage, di_page: DocumentPage
@@ -112,6 +150,25 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         """
         Export the page image and apply transformations.
 
+        :param pdf_page_img: PIL Image of the page.
+        :type pdf_page_img: PIL.Image.Image
+        :param di_page: DocumentPage object.
+        :type di_page: DocumentPage
+        :return: Transformed image object containing the original and
+            transformed image information.
+        :rtype: TransformedImage
+        """
+        # Rotation is CPU-bound PIL/OpenCV work, so keep it off the event loop
+        return await asyncio.to_thread(
+            self._export_page_img_sync, pdf_page_img, di_page
+        )
+
+    def _export_page_img_sync(
+        self, pdf_page_img: PILImage, di_page: DocumentPage
+    ) -> TransformedImage:
+        """
+        Synchronous implementation of `export_page_img`.
+
         :param pdf_page_img: PIL Image of the page.
         :type pdf_page_img: PIL.Image.Image
         :param di_page: DocumentPage object.
@@ -132,6 +189,27 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
             rotation_applied=di_page.angle if self.adjust_rotation else None,
         )
 
+    def _get_base_meta(
+        self, element_info: ElementInfo, section_heirarchy: Optional[tuple[int]]
+    ) -> Dict[str, Any]:
+        """
+        Gets the metadata shared by all outputs of a page. Each output derives
+        its own metadata dict from this rather than modifying a shared one.
+
+        :param element_info: Element information for the page.
+        :type element_info: ElementInfo
+        :param section_heirarchy: Section heirarchy for the page.
+        :type section_heirarchy: Optional[tuple[int]]
+        :return: The base metadata for the page's outputs.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "element_id": element_info.element_id,
+            "element_type": element_info.element_type_name,
+            "page_number": element_info.start_page_number,
+            "section_heirarchy": section_heirarchy,
+        }
+
     async def convert_page_start(
         self,
         element_info: ElementInfo,
@@ -151,23 +229,25 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         :return: List of HaystackDocument objects containing the page content.
         :rtype: List[Document]
         """
-        self._validate_element_type(element_info)
+        if self.strict:
+            self._validate_element_type(element_info)
         outputs: List[HaystackDocument] = list()
         meta = {
-            "element_id": element_info.element_id,
-            "element_type": type(element_info.element).__name__,
-            "page_number": element_info.start_page_number,
-            "page_location": "start",
-            "section_heirarchy": section_heirarchy,
+            **self._get_base_meta(element_info, section_heirarchy),
+            "page_location": _PAGE_LOC_START,
         }
         if self.page_img_order == "before":
             outputs.extend(
-                self._export_page_img_docs(element_info, transformed_page_img, meta)
+                await self._export_page_img_docs(
+                    element_info,
+                    transformed_page_img,
+                    {**meta, "rotation_applied": transformed_page_img.rotation_applied},
+                )
             )
         if self.page_start_text_formats:
             outputs.extend(
                 self._export_page_text_docs(
-                    element_info, self.page_start_text_formats, meta
+                    element_info, self._page_start_compiled_formats, meta
                 )
             )
         return outputs
@@ -193,25 +273,26 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         """
         outputs: List[HaystackDocument] = list()
         meta = {
-            "element_id": element_info.element_id,
-            "element_type": type(element_info.element).__name__,
-            "page_number": element_info.start_page_number,
-            "page_location": "end",
-            "section_heirarchy": section_heirarchy,
+            **self._get_base_meta(element_info, section_heirarchy),
+            "page_location": _PAGE_LOC_END,
         }
         if self.page_end_text_formats:
             outputs.extend(
                 self._export_page_text_docs(
-                    element_info, self.page_end_text_formats, meta
+                    element_info, self._page_end_compiled_formats, meta
                 )
             )
         if self.page_img_order == "after":
             outputs.extend(
-                self._export_page_img_docs(element_info, transformed_page_img, meta)
+                await self._export_page_img_docs(
+                    element_info,
+                    transformed_page_img,
+                    {**meta, "rotation_applied": transformed_page_img.rotation_applied},
+                )
             )
         return outputs
 
-    def _export_page_img_docs(
+    async def _export_page_img_docs(
         self,
         element_info: ElementInfo,
         transformed_page_img: TransformedImage,
@@ -224,21 +305,29 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         :type element_info: ElementInfo
         :param transformed_page_img: Transformed image object.
         :type transformed_page_img: TransformedImage
-        :param meta: Metadata to include in the output documents.
+        :param meta: Metadata to include in the output documents, including
+            the image's `rotation_applied`.
         :type meta: Dict[str, Any]
         :return: List of HaystackDocument objects containing the image content.
         :rtype: List[HaystackDocument]
         """
-        # Get transformed image, copying over image transformation metadata
+        # JPEG encoding is CPU-bound, so run it off the event loop. The result is
+        # cached on the image for any later outputs of the same page.
+        img_data = await asyncio.to_thread(
+            transformed_page_img.get_image_base64,
+            jpeg_quality=self.jpeg_quality,
+            color_mode=self.color_mode,
+            max_dim=self.max_dim,
+        )
+        # Get transformed image
         img_bytestream = HaystackByteStream(
-            data=pil_img_to_base64(transformed_page_img.image),
+            data=img_data,
             mime_type="image/jpeg",
         )
-        meta["rotation_applied"] = transformed_page_img.rotation_applied
         # Create output docs
         img_outputs = list()
         if self.page_img_text_intro:
-            page_intro_content = self.page_img_text_intro.format(
+            page_intro_content = self._page_img_text_intro_formatter(
                 page_number=element_info.start_page_number
             )
         else:
@@ -254,27 +343,27 @@ class DefaultDocumentPageProcessor(DocumentPageProcessor):
         return img_outputs
 
     def _export_page_text_docs(
-        self, element_info: ElementInfo, text_formats: List[str], meta: Dict[str, Any]
+        self,
+        element_info: ElementInfo,
+        compiled_formats: List[Tuple[Callable[..., str], str, bool]],
+        meta: Dict[str, Any],
     ) -> List[HaystackDocument]:
         """
         Exports text documents for the page.
 
         :param element_info: Element information for the page.
         :type element_info: ElementInfo
-        :param text_formats: List of text formats to use.
-        :type text_formats: List[str]
+        :param compiled_formats: List of compiled text formats to use, as
+            returned by `_compile_text_formats`.
+        :type compiled_formats: List[Tuple[Callable[..., str], str, bool]]
         :param meta: Metadata to include in the output documents.
         :type meta: Dict[str, Any]
         :return: List of HaystackDocument objects containing the text content.
         :rtype: List[HaystackDocument]
         """
         output_strings = list()
-        for format in text_formats:
-            has_format_placeholders = self._format_str_contains_placeholders(
-                format, self.expected_format_placeholders
-            )
-            formatted_text = format.format(page_number=element_info.start_page_number)
-            formatted_if_null = format.format(page_number="")
+        for formatter, formatted_if_null, has_format_placeholders in compiled_formats:
+            formatted_text = formatter(page_number=element_info.start_page_number)
             if formatted_text != formatted_if_null or not has_format_placeholders:
                 output_strings.append(formatted_text)
         if output_strings:
@@ -297,10 +386,32 @@ class PageSpanCalculator:
     """
 
     def __init__(self, analyze_result: AnalyzeResult):
-        self.page_span_bounds: Dict[int, SpanBounds] = self._get_page_span_bounds(
-            analyze_result
-        )
-        self._doc_end_span =  self.page_span_bounds[max(self.page_span_bounds)].end
+        # Page bounds are stored as parallel arrays. They are contiguous and in
+        # page order, so the start offsets are sorted and can be binary searched.
+        (
+            self._page_numbers,
+            self._page_offsets,
+            self._page_ends,
+        ) = self._get_page_span_bound_arrays(analyze_result)
+        self._doc_end_span = int(self._page_ends[-1])
+        self._page_span_bounds: Optional[Dict[int, SpanBounds]] = None
+
+    @property
+    def page_span_bounds(self) -> Dict[int, SpanBounds]:
+        """
+        Dictionary with page number as key and the span bounds of the page as
+        value. Built on first access.
+        """
+        if self._page_span_bounds is None:
+            self._page_span_bounds = {
+                page_num: SpanBounds(offset=offset, end=end)
+                for page_num, offset, end in zip(
+                    self._page_numbers.tolist(),
+                    self._page_offsets.tolist(),
+                    self._page_ends.tolist(),
+                )
+            }
+        return self._page_span_bounds
 
     async def determine_span_start_page(self, span_start_offset: int) -> int:
         """
@@ -313,20 +424,36 @@ class PageSpanCalculator:
         :return: The page number on which the span starts.
         :rtype: int
         """
-        if span_start_offset > self._doc_end_span:
+        return int(self.determine_span_start_pages([span_start_offset])[0])
+
+    def determine_span_start_pages(
+        self, span_start_offsets: Sequence[int]
+    ) -> np.ndarray:
+        """
+        Determines the page on which each of a sequence of spans starts.
+
+        :param span_start_offsets: Span starting offsets.
+        :type span_start_offsets: Sequence[int]
+        :raises ValueError: Raised when any span_start_offset is greater than
+            the last page's end span.
+        :return: The page number on which each span starts.
+        :rtype: np.ndarray
+        """
+        span_start_offsets = np.asarray(span_start_offsets, dtype=np.int64)
+        if span_start_offsets.size and span_start_offsets.max() > self._doc_end_span:
             raise ValueError(
-                f"span_start_offset {span_start_offset} is greater than the last page's end span ({self._doc_end_span})."
+                f"span_start_offset {span_start_offsets.max()} is greater than the last page's end span ({self._doc_end_span})."
             )
-        page_numbers = [
-            k
-            for k, v in self.page_span_bounds.items()
-            if v.offset <= span_start_offset and v.end >= span_start_offset
-        ]
-        return min(page_numbers)
-
-    def _get_page_span_bounds(
+        # Page bounds are contiguous, so a span starts on the last page whose
+        # start offset is not after the span's start offset.
+        page_idxs = (
+            np.searchsorted(self._page_offsets, span_start_offsets, side="right") - 1
+        )
+        return self._page_numbers[page_idxs]
+
+    def _get_page_span_bound_arrays(
         self, analyze_result: AnalyzeResult
-    ) -> Dict[int, SpanBounds]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Gets the span bounds for each page.
 
@@ -334,31 +461,33 @@ class PageSpanCalculator:
         :type analyze_result: AnalyzeResult
         :raises ValueError: Raised when a gap exists between the span bounds of
             two pages.
-        :return: Dictionary with page number as key and tuple of start and end.
-        :rtype: Dict[int, SpanBounds]
+        :return: Arrays of the page numbers, start offsets and end offsets of
+            each page, in page order.
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
         """
-        page_span_bounds: Dict[int, SpanBounds] = dict()
-        page_start_span = 0  # Set first page start to 0
-        for page in analyze_result.pages:
-            max_page_bound = get_min_and_max_span_bounds(page.spans).end
-            max_word_bound = (
-                get_min_and_max_span_bounds([page.words[-1].span]).end
-                if page.words
-                else -1
-            )
-            max_bound_across_elements = max(max_page_bound, max_word_bound)
-            page_span_bounds[page.page_number] = SpanBounds(
-                offset=page_start_span,
-                end=max_bound_across_elements,
-            )
-            page_start_span = max_bound_across_elements + 1
+        pages = analyze_result.pages
+        page_numbers = np.fromiter(
+            (page.page_number for page in pages), dtype=np.int64, count=len(pages)
+        )
+        # A page ends at the furthest of its own spans and its last word's span
+        page_ends = np.empty(len(pages), dtype=np.int64)
+        for idx, page in enumerate(pages):
+            max_page_bound = max(span.offset + span.length for span in page.spans)
+            if page.words:
+                last_word_span = page.words[-1].span
+                max_word_bound = last_word_span.offset + last_word_span.length
+            else:
+                max_word_bound = -1
+            page_ends[idx] = max(max_page_bound, max_word_bound)
+        # Each page starts directly after the previous one ends, with the first
+        # page starting at 0.
+        page_offsets = np.concatenate(([0], page_ends[:-1] + 1))
         # Check no spans are missed
-        last_end_span = -1
-        for page_num, span_bounds in page_span_bounds.items():
-            if span_bounds.offset != last_end_span + 1:
-                raise ValueError(
-                    f"Gap exists between span bounds of pages {page_num-1} and {page_num}"
-                )
-            last_end_span = span_bounds.end
-
-        return page_span_bounds
\ No newline at end of file
+        gaps = page_offsets[1:] != page_ends[:-1] + 1
+        if gaps.any():
+            gap_idx = int(np.argmax(gaps)) + 1
+            page_num = int(page_numbers[gap_idx])
+            raise ValueError(
+                f"Gap exists between span bounds of pages {page_num-1} and {page_num}"
+            )
+        return page_numbers, page_offsets, page_ends
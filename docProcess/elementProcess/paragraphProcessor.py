@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from azure.ai.documentintelligence.models import (
     DocumentBarcode,
@@ -11,7 +11,10 @@ from haystack.dataclasses import Document as HaystackDocument
 
 from .elementInfo import ElementInfo
 from .elementProcessor import DocumentElementProcessor
-from .elementTools import replace_content_formulas_and_barcodes
+from .elementTools import (
+    SortedSpanIndex,
+    replace_content_formulas_and_barcodes,
+)
 from .sectionProcessor import get_heading_hashes
 from .selectionMarkFormatter import SelectionMarkFormatter
 
@@ -24,17 +27,39 @@ class DocumentParagraphProcessor(DocumentElementProcessor):
     expected_elements = [DocumentParagraph]
 
     @abstractmethod
-    async def convert_paragraph(
+    def convert_paragraph(
         self,
         element_info: ElementInfo,
+        all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Method for exporting paragraph content.
         """
 
+    def convert_paragraphs(
+        self,
+        elements: Sequence[Tuple[ElementInfo, Optional[tuple[int]]]],
+        all_formulas: List[DocumentFormula],
+        all_barcodes: List[DocumentBarcode],
+        selection_mark_formatter: SelectionMarkFormatter,
+        span_index: Optional[SortedSpanIndex] = None,
+    ) -> List[List[HaystackDocument]]:
+        """
+        Converts a batch of paragraph elements with `convert_paragraph`.
+        """
+        return self._convert_elements(
+            self.convert_paragraph,
+            elements,
+            all_formulas,
+            all_barcodes,
+            selection_mark_formatter,
+            span_index=span_index,
+        )
+
 
 class DefaultDocumentParagraphProcessor(DocumentParagraphProcessor):
     """
@@ -65,6 +90,9 @@ class DefaultDocumentParagraphProcessor(DocumentParagraphProcessor):
     :type formula_format: str, optional
     :param page_number_format: Text format string for page numbers.
     :type page_number_format: str, optional
+    :param strict: Whether to validate the type of each element before
+        converting it, defaults to True.
+    :type strict: bool, optional
     """
 
     expected_format_placeholders = ["{content}", "{heading_hashes}"]
@@ -79,7 +107,9 @@ class DefaultDocumentParagraphProcessor(DocumentParagraphProcessor):
         footnote_format: Optional[str] = "*Footnote:* {content}",
         formula_format: Optional[str] = "*Formula:* {content}",
         page_number_format: Optional[str] = None,
+        strict: bool = True,
     ):
+        self.strict = strict
         self.paragraph_format_mapper = {
             None: general_text_format,
             ParagraphRole.PAGE_HEADER: page_header_format,
@@ -90,14 +120,27 @@ class DefaultDocumentParagraphProcessor(DocumentParagraphProcessor):
             ParagraphRole.FORMULA_BLOCK: formula_format,
             ParagraphRole.PAGE_NUMBER: page_number_format,
         }
+        # Map each role to its compiled format, or None if paragraphs with that
+        # role should not be exported
+        self._role_formatters: Dict[
+            Optional[ParagraphRole], Optional[Tuple[Callable[..., str], str, bool]]
+        ] = dict()
+        for role, text_format in self.paragraph_format_mapper.items():
+            if text_format:
+                self._role_formatters[role] = self._compile_content_text_format(
+                    text_format, ("content",), other_fields=("heading_hashes",)
+                )
+            else:
+                self._role_formatters[role] = None
 
-    async def convert_paragraph(
+    def convert_paragraph(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Converts a paragraph element into a Haystack Document object containing
@@ -113,37 +156,38 @@ class DefaultDocumentParagraphProcessor(DocumentParagraphProcessor):
         :type selection_mark_formatter: SelectionMarkFormatter
         :param section_heirarchy: The section heirarchy of the line.
         :type section_heirarchy: Optional[tuple[int]]
+        :param span_index: An optional index of the document's formulas and
+            barcodes, used to speed up formula and barcode substitution.
+        :type span_index: SortedSpanIndex, optional
         :return: A list of Haystack Documents containing the paragraph content.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
-        format_mapper = self.paragraph_format_mapper[element_info.element.role]
-        heading_hashes = await get_heading_hashes(
-            element_info.section_heirarchy_incremental_id
-        )
-        content = await replace_content_formulas_and_barcodes(
+        if self.strict:
+            self._validate_element_type(element_info)
+        role_formatter = self._role_formatters.get(element_info.element.role)
+        if role_formatter is None:
+            return list()
+        formatter, formatted_if_null, content_decides_output = role_formatter
+        if content_decides_output and not element_info.element.content:
+            return list()
+        content = replace_content_formulas_and_barcodes(
             element_info.element.content,
             element_info.element.spans,
             all_formulas,
             all_barcodes,
+            span_index=span_index,
         )
-        content = await selection_mark_formatter.format_content(content)
-        if format_mapper:
-            formatted_text = format_mapper.format(
-                heading_hashes=heading_hashes, content=content
+        content = selection_mark_formatter.format_content(content)
+        if content_decides_output:
+            # The format does not use the heading hashes
+            if not content:
+                return list()
+            formatted_text = formatter(content=content)
+        else:
+            heading_hashes = get_heading_hashes(
+                element_info.section_heirarchy_incremental_id
             )
-            formatted_if_null = format_mapper.format(heading_hashes="", content="")
-            if formatted_text != formatted_if_null:
-                return [
-                    HaystackDocument(
-                        id=f"{element_info.element_id}",
-                        content=formatted_text,
-                        meta={
-                            "element_id": element_info.element_id,
-                            "element_type": type(element_info.element).__name__,
-                            "page_number": element_info.start_page_number,
-                            "section_heirarchy": section_heirarchy,
-                        },
-                    )
-                ]
-        return list()
\ No newline at end of file
+            formatted_text = formatter(heading_hashes=heading_hashes, content=content)
+            if formatted_text == formatted_if_null:
+                return list()
+        return [self._make_doc(element_info, formatted_text, section_heirarchy)]
\ No newline at end of file
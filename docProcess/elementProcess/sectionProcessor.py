@@ -6,9 +6,14 @@ from haystack.dataclasses import Document as HaystackDocument
 
 from .elementInfo import ElementInfo
 from .elementProcessor import DocumentElementProcessor
+from .elementTools import compile_text_format
 
 
-async def get_heading_hashes(section_heirarchy: Optional[tuple[int]]) -> str:
+# Heading prefixes for the common heirarchy depths, so a lookup replaces
+# building a new string for every heading.
+_HEADING_HASHES = tuple("#" * depth for depth in range(9))
+
+def get_heading_hashes(section_heirarchy: Optional[tuple[int]]) -> str:
     """
     Gets the heading hashes for a section heirarchy.
 
@@ -18,9 +23,10 @@ async def get_heading_hashes(section_heirarchy: Optional[tuple[int]]) -> str:
     :return: A string containing the heading hashes.
     :rtype: str
     """
-    if section_heirarchy:
-        return "#" * len(section_heirarchy)
-    return ""
+    depth = len(section_heirarchy) if section_heirarchy else 0
+    if depth < len(_HEADING_HASHES):
+        return _HEADING_HASHES[depth]
+    return "#" * depth
 
 class DocumentSectionProcessor(DocumentElementProcessor):
     """
@@ -30,7 +36,7 @@ class DocumentSectionProcessor(DocumentElementProcessor):
     expected_elements = [DocumentSection]
 
     @abstractmethod
-    async def convert_section(
+    def convert_section(
         self,
         element_info: ElementInfo,
         section_heirarchy: Optional[tuple[int]],
@@ -58,14 +64,23 @@ class DefaultDocumentSectionProcessor(DocumentSectionProcessor):
         max_heirarchy_depth, it's section ID will be ignored. If None, all
         section ID levels will be included when printing section IDs.
     :type max_heirarchy_depth: int, optional
+    :param strict: Whether to validate the type of each element before
+        converting it, defaults to True.
+    :type strict: bool, optional
     """
 
     def __init__(
         self,
         text_format: Optional[str] = None,
         max_heirarchy_depth: Optional[int] = 3,
+        strict: bool = True,
     ):
+        self.strict = strict
         self.text_format = text_format
+        # Parse the format once rather than on every section conversion
+        if text_format:
+            self._text_formatter = compile_text_format(text_format)
+            self._null_output = self._text_formatter(section_incremental_id="")
         # If max_depth is None, ensure it is set to a high number
         if max_heirarchy_depth < 0:
             raise ValueError("max_depth must be a positive integer or None.")
@@ -73,7 +88,7 @@ class DefaultDocumentSectionProcessor(DocumentSectionProcessor):
             max_heirarchy_depth if max_heirarchy_depth is not None else 999
         )
 
-    async def convert_section(
+    def convert_section(
         self,
         element_info: ElementInfo,
         section_heirarchy: Optional[tuple[int]],
@@ -88,40 +103,27 @@ class DefaultDocumentSectionProcessor(DocumentSectionProcessor):
         :return: A list of Haystack Documents containing the section information.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
+        if self.strict:
+            self._validate_element_type(element_info)
         # Section incremental ID can be empty for the first section representing
         # the entire document. Only output text if values exist, and only if max_depth
         # is not exceeded. We want to avoid printing the same section ID -
         # e.g. (3, 1) should become 3.1 but (3, 1, 1) should be ignored if
         # max_depth is only 2.
-        if self.text_format and element_info.section_heirarchy_incremental_id:
-            if (
-                len(element_info.section_heirarchy_incremental_id)
-                <= self.max_heirarchy_depth
-            ):
+        section_incremental_id = element_info.section_heirarchy_incremental_id
+        if self.text_format and section_incremental_id:
+            if len(section_incremental_id) <= self.max_heirarchy_depth:
+                # The ID is within max_depth, so it is joined without slicing
                 section_incremental_id_text = ".".join(
-                    str(i)
-                    for i in element_info.section_heirarchy_incremental_id[
-                        : self.max_heirarchy_depth
-                    ]
+                    map(str, section_incremental_id)
                 )
             else:
                 section_incremental_id_text = ""
-            formatted_text = self.text_format.format(
+            formatted_text = self._text_formatter(
                 section_incremental_id=section_incremental_id_text
             )
-            formatted_if_null = self.text_format.format(section_incremental_id="")
-            if formatted_text != formatted_if_null:
+            if formatted_text != self._null_output:
                 return [
-                    HaystackDocument(
-                        id=f"{element_info.element_id}",
-                        content=formatted_text,
-                        meta={
-                            "element_id": element_info.element_id,
-                            "element_type": type(element_info.element).__name__,
-                            "page_number": element_info.start_page_number,
-                            "section_heirarchy": section_heirarchy,
-                        },
-                    )
+                    self._make_doc(element_info, formatted_text, section_heirarchy)
                 ]
         return list()
\ No newline at end of file
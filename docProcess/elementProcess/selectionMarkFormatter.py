@@ -1,4 +1,11 @@
+import re
 from abc import ABC, abstractmethod
+from typing import List
+
+# Separator used by `DefaultSelectionMarkFormatter.format_contents` to format
+# many strings in a single pass. This is the Unicode "symbol for unit
+# separator", which does not occur in extracted document text.
+_BATCH_FORMAT_SEPARATOR = "\u241F"
 
 
 class SelectionMarkFormatter(ABC):
@@ -7,9 +14,20 @@ class SelectionMarkFormatter(ABC):
     """
 
     @abstractmethod
-    async def format_content(self, content: str) -> str:
+    def format_content(self, content: str) -> str:
         pass
 
+    def format_contents(self, contents: List[str]) -> List[str]:
+        """
+        Formats a list of text contents, returning them in the same order.
+
+        :param contents: Text contents to format.
+        :type contents: List[str]
+        :return: Formatted text contents.
+        :rtype: List[str]
+        """
+        return [self.format_content(content) for content in contents]
+
 class DefaultSelectionMarkFormatter(SelectionMarkFormatter):
     """
     Default formatter for Selection Mark elements. This class provides a method
@@ -31,8 +49,14 @@ class DefaultSelectionMarkFormatter(SelectionMarkFormatter):
 
         self._selected_replacement = selected_replacement
         self._unselected_replacement = unselected_replacement
+        # Both placeholders are replaced in a single scan of the content
+        self._placeholder_pattern = re.compile(r":(?:un)?selected:")
+        self._placeholder_replacements = {
+            ":selected:": selected_replacement,
+            ":unselected:": unselected_replacement,
+        }
 
-    async def format_content(self, content: str) -> str:
+    def format_content(self, content: str) -> str:
         """
         Formats text content, replacing any selection mark placeholders with
         the selected or unselected replacement text.
@@ -42,6 +66,32 @@ class DefaultSelectionMarkFormatter(SelectionMarkFormatter):
         :return: Formatted text content.
         :rtype: str
         """
-        return content.replace(":selected:", self._selected_replacement).replace(
-            ":unselected:", self._unselected_replacement
-        )
\ No newline at end of file
+        # Most content has no selection marks, so skip the regex scan (and
+        # the copy of the content it returns) unless a placeholder may exist
+        if "selected:" not in content:
+            return content
+        return self._placeholder_pattern.sub(
+            lambda match: self._placeholder_replacements[match.group(0)], content
+        )
+
+    def format_contents(self, contents: List[str]) -> List[str]:
+        """
+        Formats a list of text contents in a single pass, by joining them with
+        a separator and splitting the formatted result.
+
+        :param contents: Text contents to format.
+        :type contents: List[str]
+        :return: Formatted text contents, in the same order as `contents`.
+        :rtype: List[str]
+        """
+        if type(self).format_content is not DefaultSelectionMarkFormatter.format_content:
+            # A subclass may rewrite content in ways that don't survive joining
+            return super().format_contents(contents)
+        formatted = self.format_content(_BATCH_FORMAT_SEPARATOR.join(contents)).split(
+            _BATCH_FORMAT_SEPARATOR
+        )
+        if len(formatted) != len(contents):
+            # The separator occurred in the content itself, so format each
+            # content separately instead
+            return super().format_contents(contents)
+        return formatted
\ No newline at end of file
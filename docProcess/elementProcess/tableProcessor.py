@@ -1,7 +1,7 @@
 from abc import abstractmethod
-from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from azure.ai.documentintelligence.models import (
     DocumentBarcode,
@@ -12,9 +12,77 @@ from haystack.dataclasses import Document as HaystackDocument
 
 from .elementInfo import ElementInfo
 from .elementProcessor import DocumentElementProcessor
-from .elementTools import get_element_number, replace_content_formulas_and_barcodes
+from .elementTools import (
+    SortedSpanIndex,
+    get_element_number,
+    replace_content_formulas_and_barcodes,
+)
 from .selectionMarkFormatter import SelectionMarkFormatter
 
+def _format_header_cells(cells: np.ndarray) -> List[str]:
+    """
+    Formats the header values of each column (or index values of each row)
+    of a table grid as a single string, matching how pandas labels columns
+    with one or more header levels.
+    """
+    if cells.shape[0] == 1:
+        return [str(cell) for cell in cells[0]]
+    return [str(tuple(column)) for column in cells.T]
+
+
+def render_github_markdown_table(
+    cell_grid: np.ndarray, num_header_rows: int, num_index_cols: int
+) -> str:
+    """
+    Renders a grid of table cell text as a GitHub-flavoured markdown table,
+    equivalent to the DataFrame built from the grid rendered with
+    `to_markdown(tablefmt="github")`. Cells are left-aligned and rendered
+    exactly as extracted, without numeric reformatting.
+
+    :param cell_grid: 2D object array of the text of every table cell.
+    :type cell_grid: np.ndarray
+    :param num_header_rows: Number of column header rows at the top of the
+        grid. If 0, a dummy header row is added, with the index column headed
+        "0" as in the DataFrame rendering.
+    :type num_header_rows: int
+    :param num_index_cols: Number of row header columns at the left of the
+        grid. These are rendered as a single index column.
+    :type num_index_cols: int
+    :return: The markdown table.
+    :rtype: str
+    """
+    num_body_cols = cell_grid.shape[1] - num_index_cols
+    if num_header_rows > 0:
+        header = _format_header_cells(cell_grid[:num_header_rows, num_index_cols:])
+    else:
+        header = ["<!-- -->"] * num_body_cols
+    rows = [
+        [str(cell).strip() for cell in row]
+        for row in cell_grid[num_header_rows:, num_index_cols:]
+    ]
+    if num_index_cols > 0 and rows:
+        # Without header rows, a single index column keeps the name it was
+        # given by `set_index` (the column number 0) as its header
+        header.insert(0, "0" if num_header_rows == 0 and num_index_cols == 1 else "")
+        index_values = [
+            value.strip()
+            for value in _format_header_cells(
+                cell_grid[num_header_rows:, :num_index_cols].T
+            )
+        ]
+        for row, index_value in zip(rows, index_values):
+            row.insert(0, index_value)
+    # Pad every column to the width of its widest cell, leaving at least two
+    # spaces after the header as tabulate does
+    all_rows = np.array([header] + rows, dtype=str).reshape(len(rows) + 1, -1)
+    cell_widths = np.char.str_len(all_rows)
+    widths = np.maximum(cell_widths.max(axis=0), cell_widths[0] + 2)
+    all_rows = np.char.ljust(all_rows, widths)
+    separator = "|" + "|".join(["-" * (width + 2) for width in widths.tolist()]) + "|"
+    lines = ["| " + " | ".join(row) + " |" for row in all_rows.tolist()]
+    lines.insert(1, separator)
+    return "\n".join(lines)
+
 
 class DocumentTableProcessor(DocumentElementProcessor):
     """
@@ -24,13 +92,14 @@ class DocumentTableProcessor(DocumentElementProcessor):
     expected_elements = [DocumentTable]
 
     @abstractmethod
-    async def convert_table(
+    def convert_table(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Method for exporting table elements.
@@ -54,7 +123,10 @@ class DefaultDocumentTableProcessor(DocumentTableProcessor):
         prior to the table itself.
     2. Table: The content of the table as a Haystack Document containing the
         table's content as both a markdown string (content field) and a
-        dataframe (dataframe field).
+        dataframe (dataframe field). The cell text of every row, including
+        header rows, is also stored as a list of lists in
+        `meta["table_rows"]`. Consumers that only need plain values should
+        prefer it to serializing the dataframe.
     3. After-table text: A list of text content documents that are output
         following the table itself.
 
@@ -71,6 +143,9 @@ class DefaultDocumentTableProcessor(DocumentTableProcessor):
         table itself. If None, no text content will be extracted after the
         table.
     :type after_table_text_formats: List[str], optional
+    :param strict: Whether to validate the type of each element before
+        converting it, defaults to True.
+    :type strict: bool, optional
     """
 
     expected_format_placeholders = ["{table_number}", "{caption}", "{footnotes}"]
@@ -84,17 +159,27 @@ class DefaultDocumentTableProcessor(DocumentTableProcessor):
             "*Table Content:*",
         ],
         after_table_text_formats: Optional[List[str]] = None,
+        strict: bool = True,
     ):
+        self.strict = strict
         self.before_table_text_formats = before_table_text_formats
         self.after_table_text_formats = after_table_text_formats
+        # Parse the formats once rather than on every table conversion
+        self._before_table_compiled_formats = self._compile_text_formats(
+            before_table_text_formats, table_number="", caption="", footnotes=""
+        )
+        self._after_table_compiled_formats = self._compile_text_formats(
+            after_table_text_formats, table_number="", caption="", footnotes=""
+        )
 
-    async def convert_table(
+    def convert_table(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Converts a table element into a list of Haystack Documents containing
@@ -110,65 +195,76 @@ class DefaultDocumentTableProcessor(DocumentTableProcessor):
         :type selection_mark_formatter: SelectionMarkFormatter
         :param section_heirarchy: The section heirarchy of the table.
         :type section_heirarchy: Optional[tuple[int]]
+        :param span_index: An optional index of the document's formulas and
+            barcodes, used to speed up formula and barcode substitution.
+        :type span_index: SortedSpanIndex, optional
         :return: A list of Haystack Documents containing the table content.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
+        if self.strict:
+            self._validate_element_type(element_info)
         outputs: List[HaystackDocument] = list()
         meta = {
             "element_id": element_info.element_id,
-            "element_type": type(element_info.element).__name__,
+            "element_type": element_info.element_type_name,
             "page_number": element_info.start_page_number,
             "section_heirarchy": section_heirarchy,
         }
         if self.before_table_text_formats:
             outputs.extend(
-                await self._export_table_text(
+                self._export_table_text(
                     element_info,
                     all_formulas,
                     all_barcodes,
                     selection_mark_formatter,
                     f"{element_info.element_id}_before_table_text",
-                    self.before_table_text_formats,
+                    self._before_table_compiled_formats,
                     meta,
+                    span_index=span_index,
                 )
             )
         # Convert table content
-        table_md, table_df = await self._convert_table_content(
-            element_info.element, all_formulas, all_barcodes, selection_mark_formatter
+        table_md, table_df, table_rows = self._convert_table_content(
+            element_info.element,
+            all_formulas,
+            all_barcodes,
+            selection_mark_formatter,
+            span_index=span_index,
         )
         outputs.append(
             HaystackDocument(
                 id=f"{element_info.element_id}_table",
                 content=table_md,
                 dataframe=table_df,
-                meta=meta,
+                meta={**meta, "table_rows": table_rows},
             )
         )
         if self.after_table_text_formats:
             outputs.extend(
-                await self._export_table_text(
+                self._export_table_text(
                     element_info,
                     all_formulas,
                     all_barcodes,
                     selection_mark_formatter,
                     f"{element_info.element_id}_after_table_text",
-                    self.after_table_text_formats,
+                    self._after_table_compiled_formats,
                     meta,
+                    span_index=span_index,
                 )
             )
 
         return outputs
 
-    async def _export_table_text(
+    def _export_table_text(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         id: str,
-        text_formats: List[str],
+        compiled_formats: List[Tuple[Callable[..., str], str, bool]],
         meta: Dict[str, Any],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Exports the text content for a table element.
@@ -183,50 +279,53 @@ class DefaultDocumentTableProcessor(DocumentTableProcessor):
         :type selection_mark_formatter: SelectionMarkFormatter
         :param id: ID of the table element.
         :type id: str
-        :param text_formats: List of text formats to format with the table's
-            content.
-        :type text_formats: List[str]
+        :param compiled_formats: List of compiled text formats to format with
+            the table's content, as returned by `_compile_text_formats`.
+        :type compiled_formats: List[Tuple[Callable[..., str], str, bool]]
         :param meta: Metadata for the table element.
         :type meta: Dict[str, Any]
+        :param span_index: An optional index of the document's formulas and
+            barcodes, used to speed up formula and barcode substitution.
+        :type span_index: SortedSpanIndex, optional
         :return: A list of HaystackDocument objects containing the table
             content.
         :rtype: List[HaystackDocument]
         """
-        table_number_text = await get_element_number(element_info)
+        table_number_text = get_element_number(element_info)
         caption_text = (
-            await selection_mark_formatter.format_content(
-                await replace_content_formulas_and_barcodes(
-                    element_info.element.caption.content,
-                    element_info.element.caption.spans,
-                    all_formulas,
-                    all_barcodes,
-                )
+            replace_content_formulas_and_barcodes(
+                element_info.element.caption.content,
+                element_info.element.caption.spans,
+                all_formulas,
+                all_barcodes,
+                span_index=span_index,
             )
             if getattr(element_info.element, "caption", None)
             else ""
         )
-        footnotes_text = await selection_mark_formatter.format_content(
-            "\n".join(
-                [
-                    await replace_content_formulas_and_barcodes(
-                        footnote.content, footnote.spans, all_formulas, all_barcodes
-                    )
-                    for footnote in getattr(element_info.element, "footnotes", None)
-                    or []
-                ]
-            )
+        footnotes_text = "\n".join(
+            [
+                replace_content_formulas_and_barcodes(
+                    footnote.content,
+                    footnote.spans,
+                    all_formulas,
+                    all_barcodes,
+                    span_index=span_index,
+                )
+                for footnote in getattr(element_info.element, "footnotes", None)
+                or []
+            ]
+        )
+        caption_text, footnotes_text = selection_mark_formatter.format_contents(
+            [caption_text, footnotes_text]
         )
         output_strings = list()
-        for format in text_formats:
-            has_format_placeholders = self._format_str_contains_placeholders(
-                format, self.expected_format_placeholders
-            )
-            formatted_text = format.format(
+        for formatter, formatted_if_null, has_format_placeholders in compiled_formats:
+            formatted_text = formatter(
                 table_number=table_number_text,
                 caption=caption_text,
                 footnotes=footnotes_text,
             )
-            formatted_if_null = format.format(table_number="", caption="", footnotes="")
             if formatted_text != formatted_if_null or not has_format_placeholders:
                 output_strings.append(formatted_text)
         if output_strings:
@@ -239,16 +338,17 @@ class DefaultDocumentTableProcessor(DocumentTableProcessor):
             ]
         return list()
 
-    async def _convert_table_content(
+    def _convert_table_content(
         self,
         table: DocumentTable,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
-    ) -> tuple[str, pd.DataFrame]:
+        span_index: Optional[SortedSpanIndex] = None,
+    ) -> tuple[str, pd.DataFrame, List[List[str]]]:
         """
-        Converts table content into both a markdown string and a pandas
-        DataFrame.
+        Converts table content into a markdown string, a pandas DataFrame and
+        a list of the cell text of each row.
 
         :param table: A DocumentTable element as extracted by Azure Document
             Intelligence.
@@ -259,46 +359,119 @@ class DefaultDocumentTableProcessor(DocumentTableProcessor):
         :type all_barcodes: List[DocumentBarcode]
         :param selection_mark_formatter: A formatter for selection marks.
         :type selection_mark_formatter: SelectionMarkFormatter
-        :return: A tuple of the markdown string and the pandas DataFrame.
-        :rtype: tuple[str, pd.DataFrame]
+        :param span_index: An optional index of the document's formulas and
+            barcodes, used to speed up formula and barcode substitution.
+        :type span_index: SortedSpanIndex, optional
+        :return: A tuple of the markdown string, the pandas DataFrame and the
+            table rows.
+        :rtype: tuple[str, pd.DataFrame, List[List[str]]]
         """
         ### Create pandas DataFrame
-        sorted_cells = sorted(
-            table.cells, key=lambda cell: (cell.row_index, cell.column_index)
-        )
-        cell_dict = defaultdict(list)
-
         num_header_rows = 0
         num_index_cols = 0
-        for cell in sorted_cells:
+        cell_contents = list()
+        for cell in table.cells:
             if cell.kind == "columnHeader":
                 num_header_rows = max(num_header_rows, cell.row_index + 1)
             if cell.kind == "rowHeader":
                 num_index_cols = max(num_index_cols, cell.column_index + 1)
             # Get text content
-            cell_content = await selection_mark_formatter.format_content(
-                await replace_content_formulas_and_barcodes(
-                    cell.content, cell.spans, all_formulas, all_barcodes
+            cell_contents.append(
+                replace_content_formulas_and_barcodes(
+                    cell.content,
+                    cell.spans,
+                    all_formulas,
+                    all_barcodes,
+                    span_index=span_index,
                 )
             )
-            cell_dict[cell.row_index].append(cell_content)
-        table_df = pd.DataFrame.from_dict(cell_dict, orient="index")
-        ### Create markdown text version
-        table_fmt = "github"
-        # Set index
-        if num_index_cols > 0:
-            table_df.set_index(list(range(0, num_index_cols)), inplace=True)
-        index = num_index_cols > 0
-        # Set headers
-        if num_header_rows > 0:
-            table_df = table_df.T
-            table_df.set_index(list(range(0, num_header_rows)), inplace=True)
-            table_df = table_df.T
-            table_md = table_df.to_markdown(index=index, tablefmt=table_fmt)
+        # Format selection marks for all cells at once
+        cell_contents = selection_mark_formatter.format_contents(cell_contents)
+        # Fill a grid of the table's cells, repeating the content of merged
+        # cells across every row and column they span
+        cell_grid = np.full((table.row_count, table.column_count), "", dtype=object)
+        for cell, cell_content in zip(table.cells, cell_contents):
+            cell_grid[
+                cell.row_index : cell.row_index + (cell.row_span or 1),
+                cell.column_index : cell.column_index + (cell.column_span or 1),
+            ] = cell_content
+        # Header rows become the columns and index columns become the index
+        body = cell_grid[num_header_rows:, num_index_cols:]
+        if num_header_rows > 1:
+            columns = pd.MultiIndex.from_arrays(
+                cell_grid[:num_header_rows, num_index_cols:]
+            )
+        elif num_header_rows == 1:
+            columns = pd.Index(cell_grid[0, num_index_cols:])
+        else:
+            columns = None
+        if num_index_cols > 1:
+            df_index = pd.MultiIndex.from_arrays(
+                cell_grid[num_header_rows:, :num_index_cols].T
+            )
+        elif num_index_cols == 1:
+            df_index = pd.Index(cell_grid[num_header_rows:, 0])
         else:
-            # Table has no header rows. We will create a dummy header row that has empty cells
-            table_df_temp = table_df.copy()
-            table_df_temp.columns = ["<!-- -->"] * table_df.shape[1]
-            table_md = table_df_temp.to_markdown(index=index, tablefmt=table_fmt)
+            df_index = pd.RangeIndex(num_header_rows, table.row_count)
+        table_df = pd.DataFrame(body, index=df_index, columns=columns)
+        ### Create markdown text version
+        render_markdown = (
+            self._render_markdown_with_headers
+            if num_header_rows > 0
+            else self._render_markdown_without_headers
+        )
+        table_md = render_markdown(
+            cell_grid,
+            table_df,
+            num_header_rows,
+            num_index_cols,
+            has_multiline_cells=any(
+                "\n" in cell_content for cell_content in cell_contents
+            ),
+        )
         # Add new line to end of table markdown
-        return "\n" + table_md + "\n\n", table_df
\ No newline at end of file
+        return "\n" + table_md + "\n\n", table_df, cell_grid.tolist()
+
+    def _render_markdown_with_headers(
+        self,
+        cell_grid: np.ndarray,
+        table_df: pd.DataFrame,
+        num_header_rows: int,
+        num_index_cols: int,
+        has_multiline_cells: bool,
+    ) -> str:
+        """
+        Renders the markdown of a table that has column header rows.
+        """
+        if not has_multiline_cells:
+            return render_github_markdown_table(
+                cell_grid, num_header_rows, num_index_cols
+            )
+        # Multi-line cells are laid out by tabulate
+        return table_df.to_markdown(index=num_index_cols > 0, tablefmt="github")
+
+    def _render_markdown_without_headers(
+        self,
+        cell_grid: np.ndarray,
+        table_df: pd.DataFrame,
+        num_header_rows: int,
+        num_index_cols: int,
+        has_multiline_cells: bool,
+    ) -> str:
+        """
+        Renders the markdown of a table that has no column header rows, using
+        a dummy header row of empty cells.
+        """
+        if not has_multiline_cells:
+            return render_github_markdown_table(cell_grid, 0, num_index_cols)
+        # Multi-line cells are laid out by tabulate. The dummy headers are
+        # passed to tabulate directly rather than set on a copy of the frame,
+        # so the header of a single index column is passed along with them.
+        headers = ["<!-- -->"] * table_df.shape[1]
+        if num_index_cols == 1:
+            headers.insert(0, "0")
+        return table_df.to_markdown(
+            index=num_index_cols > 0,
+            tablefmt="github",
+            headers=headers,
+        )
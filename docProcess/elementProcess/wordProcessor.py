@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from azure.ai.documentintelligence.models import (
     DocumentBarcode,
@@ -10,7 +10,10 @@ from haystack.dataclasses import Document as HaystackDocument
 
 from .elementInfo import ElementInfo
 from .elementProcessor import DocumentElementProcessor
-from .elementTools import replace_content_formulas_and_barcodes
+from .elementTools import (
+    SortedSpanIndex,
+    replace_content_formulas_and_barcodes,
+)
 from .selectionMarkFormatter import SelectionMarkFormatter
 
 
@@ -22,18 +25,39 @@ class DocumentWordProcessor(DocumentElementProcessor):
     expected_elements = [DocumentWord]
 
     @abstractmethod
-    async def convert_word(
+    def convert_word(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Method for exporting word content.
         """
 
+    def convert_words(
+        self,
+        elements: Sequence[Tuple[ElementInfo, Optional[tuple[int]]]],
+        all_formulas: List[DocumentFormula],
+        all_barcodes: List[DocumentBarcode],
+        selection_mark_formatter: SelectionMarkFormatter,
+        span_index: Optional[SortedSpanIndex] = None,
+    ) -> List[List[HaystackDocument]]:
+        """
+        Converts a batch of word elements with `convert_word`.
+        """
+        return self._convert_elements(
+            self.convert_word,
+            elements,
+            all_formulas,
+            all_barcodes,
+            selection_mark_formatter,
+            span_index=span_index,
+        )
+
 class DefaultDocumentWordProcessor(DocumentWordProcessor):
     """
     The default processor for DocumentWord elements. This class provides a
@@ -47,21 +71,33 @@ class DefaultDocumentWordProcessor(DocumentWordProcessor):
         the content which should be extracted from the element. If set to None,
         no text content will be extracted from the element.
     :type text_format: str, optional
+    :param strict: Whether to validate the type of each element before
+        converting it, defaults to True.
+    :type strict: bool, optional
     """
 
     def __init__(
         self,
         text_format: Optional[str] = "{content}",
+        strict: bool = True,
     ):
+        self.strict = strict
         self.text_format = text_format
+        if text_format:
+            (
+                self._text_formatter,
+                self._null_output,
+                self._content_decides_output,
+            ) = self._compile_content_text_format(text_format, ("content",))
 
-    async def convert_word(
+    def convert_word(
         self,
         element_info: ElementInfo,
         all_formulas: List[DocumentFormula],
         all_barcodes: List[DocumentBarcode],
         selection_mark_formatter: SelectionMarkFormatter,
         section_heirarchy: Optional[tuple[int]],
+        span_index: Optional[SortedSpanIndex] = None,
     ) -> List[HaystackDocument]:
         """
         Converts a word element into a Haystack Document object containing the
@@ -77,32 +113,29 @@ class DefaultDocumentWordProcessor(DocumentWordProcessor):
         :type selection_mark_formatter: SelectionMarkFormatter
         :param section_heirarchy: The section heirarchy of the word.
         :type section_heirarchy: Optional[tuple[int]]
+        :param span_index: An optional index of the document's formulas and
+            barcodes, used to speed up formula and barcode substitution.
+        :type span_index: SortedSpanIndex, optional
         :return: A list of Haystack Documents containing the word content.
         :rtype: List[HaystackDocument]
         """
-        self._validate_element_type(element_info)
-        content = await replace_content_formulas_and_barcodes(
+        if self.strict:
+            self._validate_element_type(element_info)
+        content = replace_content_formulas_and_barcodes(
             element_info.element.content,
             [element_info.element.span],
             all_formulas,
             all_barcodes,
+            span_index=span_index,
         )
-        content = await selection_mark_formatter.format_content(content)
+        content = selection_mark_formatter.format_content(content)
         if self.text_format:
-            formatted_text = self.text_format.format(content=content)
-            formatted_if_null = self.text_format.format(content="")
-            if formatted_text != formatted_if_null:
-                return [
-                    HaystackDocument(
-                        id=f"{element_info.element_id}",
-                        content=self.text_format.format(content=content),
-                        meta={
-                            "element_id": element_info.element_id,
-                            "element_type": type(element_info.element).__name__,
-                            "page_number": element_info.start_page_number,
-                            "section_heirarchy": section_heirarchy,
-                        },
-                    )
-                ]
+            formatted_text = self._text_formatter(content=content)
+            if self._content_decides_output:
+                if not content:
+                    return list()
+            elif formatted_text == self._null_output:
+                return list()
+            return [self._make_doc(element_info, formatted_text, section_heirarchy)]
         return list()
 
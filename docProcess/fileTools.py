@@ -10,11 +10,36 @@ from PIL import Image
 from PIL.Image import Image as PILImage
 
 
-def convert_pdf_to_base64(pdf_path: str):
+# Read size used when base64-encoding files. This is a multiple of 3, so each
+# chunk encodes without padding and the encoded chunks can be concatenated.
+BASE64_READ_CHUNK_SIZE = 57 * 1024
+
+def _read_file_base64(file_path: str) -> bytearray:
+    """
+    Reads a file and base64-encodes it, streaming the file in chunks so the
+    whole raw file is never held in memory alongside its encoding.
+    """
+    encoded = bytearray()
+    with open(file_path, "rb", buffering=1 << 20) as file:
+        while chunk := file.read(BASE64_READ_CHUNK_SIZE):
+            encoded += base64.b64encode(chunk)
+    return encoded
+
+def convert_pdf_to_base64_bytes(pdf_path: str) -> bytes:
+    """
+    Reads a PDF file and encodes it to base64, for consumers that accept
+    bytes and would otherwise re-encode the string form.
+
+    :param pdf_path: Path to the PDF file.
+    :type pdf_path: str
+    :return: The base64-encoded file content.
+    :rtype: bytes
+    """
+    return bytes(_read_file_base64(pdf_path))
+
+def convert_pdf_to_base64(pdf_path: str) -> str:
     # Read the PDF file in binary mode, encode it to base64, and decode to string
-    with open(pdf_path, "rb") as file:
-        base64_encoded_pdf = base64.b64encode(file.read()).decode()
-    return base64_encoded_pdf
+    return _read_file_base64(pdf_path).decode("ascii")
 
 def base64_bytes_to_buffer(b64_str: bytes, name: Optional[str] = None) -> io.BytesIO:
     """Convert a base64 bytes object to a BytesIO object."""
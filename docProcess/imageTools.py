@@ -1,9 +1,9 @@
 import base64
 import io
 import itertools
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from io import BytesIO
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -11,17 +11,19 @@ from PIL import Image, ImageDraw
 from PIL.Image import Image as PILImage
 
 
-def pil_img_to_base64(pil_img: PILImage) -> str:
+def pil_img_to_base64(pil_img: PILImage, quality: int = 75) -> str:
     """
     Converts a PIL image to a base64 encoded string.
 
     :param pil_img: The PIL image to convert.
     :type pil_img: PIL.Image.Image
+    :param quality: JPEG quality to encode the image with, defaults to 75
+    :type quality: int, optional
     :return: A base64 encoded string.
     :rtype: str
     """
     buffered = BytesIO()
-    pil_img.save(buffered, format="JPEG")
+    pil_img.save(buffered, format="JPEG", quality=quality)
     return base64.b64encode(buffered.getvalue())
 
 
@@ -198,6 +200,52 @@ class TransformedImage:
     image: PILImage
     orig_image: PILImage
     rotation_applied: float
+    _image_base64_cache: Dict[Tuple[int, str, Optional[int]], bytes] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @property
+    def image_base64(self) -> bytes:
+        """
+        The transformed image as base64 encoded JPEG bytes, encoded on first
+        access and reused by every output that embeds the page image.
+        """
+        return self.get_image_base64()
+
+    def get_image_base64(
+        self,
+        jpeg_quality: int = 75,
+        color_mode: Literal["RGB", "L"] = "RGB",
+        max_dim: Optional[int] = None,
+    ) -> bytes:
+        """
+        Gets the transformed image as base64 encoded JPEG bytes. Each
+        combination of export settings is encoded once and then cached.
+
+        :param jpeg_quality: JPEG quality to encode the image with, defaults
+            to 75
+        :type jpeg_quality: int, optional
+        :param color_mode: Color mode of the exported image. "L" exports a
+            grayscale image, defaults to "RGB"
+        :type color_mode: Literal["RGB", "L"], optional
+        :param max_dim: If provided, the image is downsized so that neither
+            side exceeds this many pixels, defaults to None
+        :type max_dim: int, optional
+        :return: Base64 encoded JPEG bytes.
+        :rtype: bytes
+        """
+        cache_key = (jpeg_quality, color_mode, max_dim)
+        if cache_key not in self._image_base64_cache:
+            export_img = self.image
+            if max_dim:
+                export_img = export_img.copy()
+                export_img.thumbnail((max_dim, max_dim))
+            if color_mode == "L" and export_img.mode != "L":
+                export_img = export_img.convert("L")
+            self._image_base64_cache[cache_key] = pil_img_to_base64(
+                export_img, quality=jpeg_quality
+            )
+        return self._image_base64_cache[cache_key]
 
 
 def crop_img(img: PILImage, crop_poly: list[float]) -> PILImage:
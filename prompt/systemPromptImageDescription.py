@@ -1,5 +1,3 @@
-from langchain_core.prompts import SystemMessagePromptTemplate
-
 systemTemplateImageDescripter='''
 # Role
 You are a SME(Subject Matter Expert) in domain of ${domain}.
@@ -9,4 +7,8 @@ Your task is to descript the image content according the context that the user p
 Please generate the response in the language of the user's request in less than 200 words.
 '''
 
-system_prompt_image_descripter = SystemMessagePromptTemplate.from_template(systemTemplateImageDescripter)
\ No newline at end of file
+# The template is only formatted with plain keyword substitution, so render
+# it with str.format_map rather than a LangChain prompt template, which
+# re-parses the template on every call
+def render_system_prompt_image_descripter(domain: str) -> str:
+    return systemTemplateImageDescripter.format_map({"domain": domain})
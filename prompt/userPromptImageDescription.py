@@ -1,5 +1,3 @@
-from langchain_core.prompts import HumanMessagePromptTemplate
-
 userPromptTemplateImageDescriptor = '''
     Describe the image in the page. current page content is as follows:
     ${page_content}
@@ -7,4 +5,7 @@ userPromptTemplateImageDescriptor = '''
     Then he image content can be described as follows:
 '''
 
-user_prompt_image_descriptor = HumanMessagePromptTemplate.from_template(userPromptTemplateImageDescriptor)
\ No newline at end of file
+def render_user_prompt_image_descriptor(page_content: str, image_caption: str) -> str:
+    return userPromptTemplateImageDescriptor.format_map(
+        {"page_content": page_content, "image_caption": image_caption}
+    )
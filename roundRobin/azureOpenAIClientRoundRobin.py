@@ -1,4 +1,4 @@
-import asyncio
+import itertools
 import json
 import logging
 import os
@@ -17,6 +17,8 @@ deploymentName = os.getenv("AZURE_OPENAI_ROUND_ROBIN_DEPLOYMENT_NAME","gpt-4o")
 
 @dataclass
 class AzureOpenAIConnection:
+    __slots__ = ("endpoint", "apiKey")
+
     endpoint: str
     apiKey: str
 
@@ -24,16 +26,16 @@ class AzureOpenAIClientsRoundRobin:
     def __init__(self):
         self.clients = _build_azure_oppen_AI_async_clients(azureOpenAIRoundRobinConnection)
         self.client_count = len(self.clients)
-        self.index = 0  # init
-        self.lock = asyncio.Lock()
+        # next() on a cycle is a single C call, so it never interleaves with
+        # another task and no lock is needed
+        self._client_cycle = itertools.cycle(self.clients)
     
     async def get_next_client(self):
-        async with self.lock: 
-            # get client
-            client = self.clients[self.index]
-            # update index 
-            self.index = (self.index + 1) % self.client_count
-            return client
+        if not self.client_count:
+            raise ValueError(
+                "No Azure OpenAI connections are configured in AZURE_OPENAI_ROUND_ROBIN_CONNETION."
+            )
+        return next(self._client_cycle)
 
 def _load_connections(azureOpenAIRoundRobinConnection:str)->list[AzureOpenAIConnection]:
     data_list = json.loads(azureOpenAIRoundRobinConnection)
@@ -1,48 +1,41 @@
 import asyncio
+import atexit
+import logging
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
 
-import tiktoken
+import numpy as np
 from dotenv import load_dotenv
-from langchain.text_splitter import MarkdownHeaderTextSplitter
-from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from cache.cacheConfig import async_diskcache, cache
 
 from .dataMode import MergedChunk, MergedChunkFile, SplitResult
 from .semanticChunk import process_big_chunk_file, process_small_chunk_file
+from .splitWorker import (
+    headers_to_split_on,
+    init_split_worker,
+    split_and_count_tokens,
+    text_splitter,
+)
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
 
-headers_to_split_on = [
-    ("#", "Header 1"),
-    ("##", "Header 2"),
-    ("###", "Header 3")
-]
-
-text_splitter = MarkdownHeaderTextSplitter(headers_to_split_on=headers_to_split_on,return_each_line=False,strip_headers=False)
+# set the path to save the split files
+SPLIT_CHUNK_FILE_PATH = Path(os.getenv("SPLIT_CHUNK_FILE_PATH","processed_documents/markdown/splitChunk/"))
+SPLIT_CHUNK_FILE_PATH.mkdir(parents=True, exist_ok=True)
 
 # set the path to save the merged chunk file
-SPLIT_CHUNK_FILE_PATH = os.getenv("SPLIT_CHUNK_FILE_PATH","processed_documents/markdown/splitChunk/")
-if not os.path.exists(SPLIT_CHUNK_FILE_PATH):
-    os.makedirs(SPLIT_CHUNK_FILE_PATH)
+MERGE_CHUNK_FILE_PATH = Path(os.getenv("MERGE_CHUNK_FILE_PATH","processed_documents/markdown/mergedChunk/"))
+MERGE_CHUNK_FILE_PATH.mkdir(parents=True, exist_ok=True)
 
-#@async_diskcache("split_content_by_markdown_header")
-@retry(wait=wait_random_exponential(multiplier=1, max=60), stop=stop_after_attempt(3))
-async def splitContentByMarkdownHeader(docMarkdownStr:str,filename:str)->list[SplitResult]:
-    splits = text_splitter.split_text(docMarkdownStr)
-    encoding = tiktoken.get_encoding(os.getenv("LLM_CODER","o200k_base"))
-    splitResult = []
-    for idx, split in enumerate(splits): 
-        split_token_count = len(encoding.encode(split.page_content))
-        splitResult.append(SplitResult(tokens=split_token_count,content=split.page_content))
-        with open(SPLIT_CHUNK_FILE_PATH + filename + f"_split_{idx}.md", "w", encoding="utf-8") as f:
-            f.write(split.page_content)
-    return splitResult
-
-
-# set the 
+# set the tiktoken encoding used to count the tokens of each split
+LLM_CODER = os.getenv("LLM_CODER","o200k_base")
+# set the size below which a split or chunk is always merged
 SPIPPETS_SIZE=int(os.getenv("SPIPPETS_SIZE","600"))
 # set the miminum size of the split content  
 CHUNK_MIN_SIZE = int(os.getenv("CHUNK_MIN_SIZE","1000"))  
@@ -50,84 +43,140 @@ CHUNK_MIN_SIZE = int(os.getenv("CHUNK_MIN_SIZE","1000"))
 CHUNK_MAX_SIZE = int(os.getenv("CHUNK_MAX_SIZE","1400"))
 # set the abusolute maximum size of the split content
 CHUNK_ABUSOLUTE_MAX_SIZE = int(os.getenv("CHUNK_ABUSOLUTE_MAX_SIZE","2400"))
+# set the number of worker processes used to split and tokenize documents
+SPLIT_PROCESS_MAX_WORKERS = int(os.getenv("SPLIT_PROCESS_MAX_WORKERS", str(os.cpu_count() or 1)))
+
+_split_process_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_split_process_pool()->ProcessPoolExecutor:
+    # the pool is created on first use, so importing the module doesn't start
+    # any worker processes
+    global _split_process_pool
+    if _split_process_pool is None:
+        _split_process_pool = ProcessPoolExecutor(
+            max_workers=SPLIT_PROCESS_MAX_WORKERS,
+            initializer=init_split_worker,
+            initargs=(LLM_CODER,),
+        )
+    return _split_process_pool
+
+@atexit.register
+def shutdown_split_process_pool():
+    """shut down the split worker processes, if they were started"""
+    global _split_process_pool
+    if _split_process_pool is not None:
+        _split_process_pool.shutdown()
+        _split_process_pool = None
+
+def _write_text_file(file_path:Union[Path,str],content:str):
+    # write the encoded content straight to the file descriptor, skipping the
+    # buffered text layer of open()
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
+#@async_diskcache("split_content_by_markdown_header")
+async def splitContentByMarkdownHeader(docMarkdownStr:str,filename:str)->list[SplitResult]:
+    # splitting and tokenizing are CPU-bound, so both run in a worker process,
+    # letting documents split concurrently use all cores
+    splitResult = await asyncio.get_running_loop().run_in_executor(
+        _get_split_process_pool(), split_and_count_tokens, docMarkdownStr, LLM_CODER
+    )
+    # write the split files in worker threads so the event loop is not blocked
+    await asyncio.gather(*[
+        asyncio.to_thread(_write_text_file, SPLIT_CHUNK_FILE_PATH / f"{filename}_split_{idx}.md", split.content)
+        for idx, split in enumerate(splitResult)
+    ])
+    return splitResult
 
 
 async def mergeSpitsIntoChunk(splitResult: list[SplitResult]) -> list[MergedChunk]:
     # store the merged chunks  
     mergedChunkList = []  
+    splitCount = len(splitResult)
+    splitTokens = np.fromiter((split.tokens for split in splitResult), dtype=np.int64, count=splitCount)
+    # prefix sums of the split tokens, so the tokens of splits [i, j) are
+    # cumulativeTokens[j] - cumulativeTokens[i]
+    cumulativeTokens = np.concatenate(([0], np.cumsum(splitTokens)))
     index = 0  # current index of the split result
-    while index < len(splitResult):
-        print("...processing the split: " + str(index))  
-        currentSplit = splitResult[index]
-        currentSplitContent = currentSplit.content
-        currentSplitTokens = currentSplit.tokens
+    while index < splitCount:
+        logger.debug("...processing the split: %s", index)
+        currentSplitTokens = int(splitTokens[index])
 
         # if the current split is bigger than the maximum size, keep it as is
         if CHUNK_MIN_SIZE <= currentSplitTokens:  
-            mergedChunk = MergedChunk(splits=currentSplitContent, totalTokens=currentSplitTokens, note="it is bigger than chunk min size,keep as is")
+            mergedChunk = MergedChunk(splits=splitResult[index].content, totalTokens=currentSplitTokens, note="it is bigger than chunk min size,keep as is")
             mergedChunkList.append(mergedChunk)  
             index += 1   
-        # if the current split is smaller than the minimum size, merge it with the next split
+        # if the current split is smaller than the minimum size, merge it with the next splits
         else:
-            combinedTokens = currentSplitTokens  
-            combinedContent = currentSplitContent
-            index += 1  
-    
-            while combinedTokens < CHUNK_MAX_SIZE and index < len(splitResult):
-                currentSplit = splitResult[index]
-                currentSplitContent = currentSplit.content
-                currentSplitTokens = currentSplit.tokens 
-                combinedTokens += currentSplitTokens
-
-                if combinedTokens < CHUNK_MAX_SIZE or currentSplitTokens < SPIPPETS_SIZE or ((combinedTokens -currentSplitTokens) < SPIPPETS_SIZE) :
-                    # if combined tokens is less than the maximum size, add the current split to the combined content or the chunk is less than the spippet size
-                    combinedContent += "\n" + currentSplitContent
-                    index += 1
-                else:
-                    # remove the last split if the combined tokens is greater than the maximum size
-                    combinedTokens -=currentSplitTokens
-                    break  
+            startTokens = cumulativeTokens[index]
+            # splits are only added while the combined tokens are below the
+            # maximum size, so the merge can't reach past the first split where
+            # the combined tokens before it reach the maximum size
+            candidatesStart = index + 1
+            candidatesEnd = max(
+                min(int(np.searchsorted(cumulativeTokens, startTokens + CHUNK_MAX_SIZE, side="left")), splitCount),
+                candidatesStart,
+            )
+            tokensBefore = cumulativeTokens[candidatesStart:candidatesEnd] - startTokens
+            tokensAfter = cumulativeTokens[candidatesStart + 1:candidatesEnd + 1] - startTokens
+            # a split is added if the combined tokens stay below the maximum size,
+            # or if the split or the chunk so far is less than the snippet size
+            isAdded = (
+                (tokensAfter < CHUNK_MAX_SIZE)
+                | (splitTokens[candidatesStart:candidatesEnd] < SPIPPETS_SIZE)
+                | (tokensBefore < SPIPPETS_SIZE)
+            )
+            notAdded = np.flatnonzero(~isAdded)
+            # the merge stops at the first split that is not added
+            mergeEnd = candidatesStart + int(notAdded[0]) if notAdded.size else candidatesEnd
+            combinedTokens = int(cumulativeTokens[mergeEnd] - startTokens)
+            combinedContent = "\n".join(split.content for split in splitResult[index:mergeEnd])
+            index = mergeEnd
                 
             mergedChunk = MergedChunk(splits=combinedContent, totalTokens=combinedTokens, note="it is bigger than chunk min size,keep as is")
             mergedChunkList.append(mergedChunk)
         
     # if the final split is smaller than the minimum size, merge it with the previous split
-    lastMergedChunk = mergedChunkList.pop()
-    if lastMergedChunk.totalTokens < CHUNK_MIN_SIZE:
-        secondLastMergedChunk = mergedChunkList.pop()
+    if len(mergedChunkList) > 1 and mergedChunkList[-1].totalTokens < CHUNK_MIN_SIZE:
+        lastMergedChunk = mergedChunkList.pop()
+        # the previous chunk is updated in place with a single concatenation
+        secondLastMergedChunk = mergedChunkList[-1]
         secondLastMergedChunk.splits += lastMergedChunk.splits
         secondLastMergedChunk.totalTokens += lastMergedChunk.totalTokens
-        mergedChunkList.append(secondLastMergedChunk)
 
     return mergedChunkList
 
-# set the path to save the merged chunk file
-MERGE_CHUNK_FILE_PATH = os.getenv("MERGE_CHUNK_FILE_PATH","processed_documents/markdown/mergedChunk/")
-if not os.path.exists(MERGE_CHUNK_FILE_PATH):
-    os.makedirs(MERGE_CHUNK_FILE_PATH)
-
 async def saveMergedChunkIntoFile(mergedChunkList: list[MergedChunk],filename:str)->list[MergedChunkFile]:
 
-    MergedChunkFileList = []
-    for idx, chunk in enumerate(mergedChunkList):  
-        file_name = f"{filename}_{idx}_chunk_tokens_{chunk.totalTokens}.md"
-        abPath = MERGE_CHUNK_FILE_PATH + file_name
-        
-        mergedChunkFile=MergedChunkFile(filePath=abPath,totalTokens=chunk.totalTokens)
-        MergedChunkFileList.append(mergedChunkFile)
-        
-        with open(abPath, "w", encoding="utf-8") as file:
-            file.write(chunk.splits)
+    MergedChunkFileList = [
+        MergedChunkFile(
+            filePath=str(MERGE_CHUNK_FILE_PATH / f"{filename}_{idx}_chunk_tokens_{chunk.totalTokens}.md"),
+            totalTokens=chunk.totalTokens,
+        )
+        for idx, chunk in enumerate(mergedChunkList)
+    ]
+    await asyncio.gather(*[
+        asyncio.to_thread(_write_text_file, mergedChunkFile.filePath, chunk.splits)
+        for mergedChunkFile, chunk in zip(MergedChunkFileList, mergedChunkList)
+    ])
     return MergedChunkFileList
 
 async def processMergdeChunkFile(mergedChunkFileList:list[MergedChunkFile]):
-    chunkTasks = [process_big_chunk_file(mergedChunkFile.filePath) for mergedChunkFile in mergedChunkFileList if mergedChunkFile.totalTokens >= CHUNK_ABUSOLUTE_MAX_SIZE]
-    copyTasks = [process_small_chunk_file(mergedChunkFile.filePath) for mergedChunkFile in mergedChunkFileList if mergedChunkFile.totalTokens < CHUNK_ABUSOLUTE_MAX_SIZE]
-    await asyncio.gather(*copyTasks)
-    # run the tasks concurrently
-    results = await asyncio.gather(*chunkTasks)
-    print(results)
+    # big chunk files are chunked again by the LLM, small ones are copied as is
+    tasks = [
+        process_big_chunk_file(mergedChunkFile.filePath)
+        if mergedChunkFile.totalTokens >= CHUNK_ABUSOLUTE_MAX_SIZE
+        else process_small_chunk_file(mergedChunkFile.filePath)
+        for mergedChunkFile in mergedChunkFileList
+    ]
+    # run the copies and the LLM chunking concurrently
+    await asyncio.gather(*tasks)
 
 
 
@@ -1,24 +1,40 @@
+from dataclasses import dataclass
+
 from pydantic import BaseModel
 
 
+# ChunkResult is the LLM's structured output format, so it stays a pydantic
+# model. The other classes only carry data between the chunking steps.
 class ChunkResult(BaseModel):
     chunks: list[str]
 
 
-class SplitResult(BaseModel):
+@dataclass
+class SplitResult:
+    __slots__ = ("tokens", "content")
+
     tokens: int
     content: str
 
-class MergedChunk(BaseModel):
+@dataclass
+class MergedChunk:
+    __slots__ = ("splits", "totalTokens", "note")
+
     splits: str
     totalTokens: int
     note: str
 
-class MergedChunkFile(BaseModel):
+@dataclass
+class MergedChunkFile:
+    __slots__ = ("filePath", "totalTokens")
+
     filePath: str
     totalTokens: int
 
-class ChunkFinalResult(BaseModel):
+@dataclass
+class ChunkFinalResult:
+    __slots__ = ("title", "chunk", "context", "fileName")
+
     title: str
     chunk: str
     context: str
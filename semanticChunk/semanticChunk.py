@@ -1,8 +1,10 @@
 import asyncio
+import hashlib
+import logging
 import os
 import shutil
+from pathlib import Path
 
-import aiofiles
 from dotenv import load_dotenv
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
@@ -14,19 +16,29 @@ from roundRobin.azureOpenAIClientRoundRobin import (
 
 from .dataMode import ChunkResult
 
+logger = logging.getLogger(__name__)
+
 SEM = asyncio.Semaphore(int(os.getenv("CONCURRENT_SIZE","10")))  # controls the number of concurrent 
+# replace with the model deployment name of your gpt-4o 2024-08-06 deployment
+STRUCTURE_OUTPUT_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_STRUCTURE_OUTPUT_DEPLOYMENT_NAME","gpt-4o-0806")
 
 async def read_file(file_path):
     """read file content"""
-    async with aiofiles.open(file_path, mode='r') as f:
-        return await f.read()
+    return await asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
     
-#@async_diskcache("content_chunk_by_llm")
+# cache LLM chunking results by content. The deployment and the prompt are part
+# of the cache name, so changing either of them doesn't reuse stale results
+CONTENT_CHUNK_CACHE_NAME = "content_chunk_by_llm:{}:{}".format(
+    STRUCTURE_OUTPUT_DEPLOYMENT_NAME,
+    hashlib.sha256(senamicChunkSystemTemplate.encode()).hexdigest(),
+)
+
+@async_diskcache(CONTENT_CHUNK_CACHE_NAME, memory_cache_size=1024)
 @retry(wait=wait_random_exponential(multiplier=1, max=60), stop=stop_after_attempt(3))
 async def content_chunk_by_llm(content:str)->list[str]:
     asyncAzureOpenAIClient =  await asyncAzureOpenAIStructedOutputClientManager.get_next_client()
     completion = await asyncAzureOpenAIClient.beta.chat.completions.parse(
-    model=os.getenv("AZURE_OPENAI_STRUCTURE_OUTPUT_DEPLOYMENT_NAME","gpt-4o-0806"), # replace with the model deployment name of your gpt-4o 2024-08-06 deployment
+    model=STRUCTURE_OUTPUT_DEPLOYMENT_NAME,
     messages=[
         {"role": "system", "content": senamicChunkSystemTemplate},
         {"role": "user", "content": content},
@@ -43,9 +55,8 @@ async def parse_file_path(file_path):
     return path, name, ext
 
 
-LLM_CHUNK_PATH = os.getenv("LLM_CHUNK_PATH","processed_documents/markdown/finalChunk/") 
-if not os.path.exists(LLM_CHUNK_PATH):
-    os.makedirs(LLM_CHUNK_PATH)
+LLM_CHUNK_PATH = Path(os.getenv("LLM_CHUNK_PATH","processed_documents/markdown/finalChunk/"))
+LLM_CHUNK_PATH.mkdir(parents=True, exist_ok=True)
 
 
 async def process_big_chunk_file(file_path):
@@ -55,24 +66,33 @@ async def process_big_chunk_file(file_path):
         file_content = await read_file(file_path)
         # chunk the content by llm
         chunkResult = await content_chunk_by_llm(file_content)
-        if chunkResult:
-            path, name, ext = await parse_file_path(file_path)
-            for index,chunk in enumerate(chunkResult.chunks):
-                new_file_name = f"{name}_part_{index}{ext}"
-                new_file_path = os.path.join(LLM_CHUNK_PATH, new_file_name)
-                async with aiofiles.open(new_file_path, mode='w') as f:
-                    await f.write(str(chunk))  # write the chunk to the new file
-                    print(f"Saved file: {new_file_path}")
+    # write the chunks after releasing the semaphore, so the next LLM request
+    # can start while the files are written
+    if chunkResult:
+        path, name, ext = await parse_file_path(file_path)
+        new_file_paths = [
+            LLM_CHUNK_PATH / f"{name}_part_{index}{ext}"
+            for index in range(len(chunkResult.chunks))
+        ]
+        # write all chunks to their new files concurrently
+        await asyncio.gather(*[
+            asyncio.to_thread(new_file_path.write_text, str(chunk), encoding="utf-8")
+            for new_file_path, chunk in zip(new_file_paths, chunkResult.chunks)
+        ])
+        for new_file_path in new_file_paths:
+            logger.debug("Saved file: %s", new_file_path)
     return {"...processed file_path": file_path}
 
 async def process_small_chunk_file(filepath):
-    if not os.path.isfile(filepath):
-        raise FileNotFoundError(f"Source file does not exist: {filepath}")
-
-    os.makedirs(LLM_CHUNK_PATH, exist_ok=True)
-    dest_file_path = os.path.join(LLM_CHUNK_PATH, os.path.basename(filepath))
-    shutil.copy(filepath, dest_file_path)
-    print(f"File copied to: {dest_file_path}")
+    # LLM_CHUNK_PATH is created when the module is imported. A missing source
+    # file raises FileNotFoundError from copyfile, so it isn't checked first.
+    dest_file_path = LLM_CHUNK_PATH / os.path.basename(filepath)
+    if os.path.abspath(filepath) == os.path.abspath(dest_file_path):
+        return
+    # copyfile skips copying permission bits, which the chunk files don't need,
+    # and copies with sendfile on Linux so the data never passes through Python
+    await asyncio.to_thread(shutil.copyfile, filepath, dest_file_path)
+    logger.debug("File copied to: %s", dest_file_path)
 
 async def get_LLM_chunk_file_list():
     """get the list of LLM chunk files"""
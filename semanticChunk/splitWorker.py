@@ -0,0 +1,48 @@
+# Markdown splitting and token counting for documents split in worker
+# processes. This module only depends on the splitter, tiktoken and the
+# data models, so spawned workers don't import the LLM clients or the cache.
+from functools import lru_cache
+
+import tiktoken
+from langchain.text_splitter import MarkdownHeaderTextSplitter
+
+from .dataMode import SplitResult
+
+headers_to_split_on = [
+    ("#", "Header 1"),
+    ("##", "Header 2"),
+    ("###", "Header 3")
+]
+
+text_splitter = MarkdownHeaderTextSplitter(headers_to_split_on=headers_to_split_on,return_each_line=False,strip_headers=False)
+
+@lru_cache(maxsize=4)
+def get_encoding(encoding_name:str)->tiktoken.Encoding:
+    # load each encoding once per process rather than on every split call
+    return tiktoken.get_encoding(encoding_name)
+
+def init_split_worker(encoding_name:str):
+    # build the encoding when the worker starts rather than in its first task
+    get_encoding(encoding_name)
+
+def count_split_tokens(split_contents:list[str],encoding_name:str,num_threads:int=1)->list[int]:
+    # Only the token counts are needed, so the token lists are dropped as soon
+    # as they are counted. Special tokens are intentionally not handled, as
+    # markdown content never contains them.
+    return [
+        len(split_tokens)
+        for split_tokens in get_encoding(encoding_name).encode_ordinary_batch(
+            split_contents, num_threads=num_threads
+        )
+    ]
+
+def split_and_count_tokens(docMarkdownStr:str,encoding_name:str)->list[SplitResult]:
+    splits = text_splitter.split_text(docMarkdownStr)
+    split_contents = [split.page_content for split in splits]
+    # the documents are already spread across worker processes, so each
+    # worker encodes on a single thread rather than oversubscribing the CPU
+    split_token_counts = count_split_tokens(split_contents, encoding_name, num_threads=1)
+    return [
+        SplitResult(tokens=split_token_count,content=split_content)
+        for split_content, split_token_count in zip(split_contents, split_token_counts)
+    ]
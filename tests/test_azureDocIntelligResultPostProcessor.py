@@ -0,0 +1,245 @@
+import asyncio
+
+import pytest
+from azure.ai.documentintelligence.models import (
+    AnalyzeResult,
+    BoundingRegion,
+    DocumentFigure,
+    DocumentKeyValueElement,
+    DocumentKeyValuePair,
+    DocumentLine,
+    DocumentPage,
+    DocumentParagraph,
+    DocumentSection,
+    DocumentSpan,
+    DocumentWord,
+)
+from PIL import Image
+
+from docProcess.azureDocIntelligResultPostProcessor import (
+    DocumentIntelligenceResultPostProcessor,
+    create_page_process_pool,
+)
+from docProcess.elementProcess.figureProcessor import DocumentFigureProcessor
+
+
+def _build_analyze_result(num_pages: int = 4) -> AnalyzeResult:
+    """
+    Builds a synthetic result where each page has a paragraph covering its
+    first two lines, a key value pair covering its third line, and a fourth
+    line that is not contained in any other element.
+    """
+    content_parts = list()
+    pages = list()
+    paragraphs = list()
+    key_value_pairs = list()
+    offset = 0
+    for page_number in range(1, num_pages + 1):
+        page_offset = offset
+        lines = list()
+        words = list()
+        for line_idx in range(4):
+            line_words = [f"p{page_number}l{line_idx}w{word_idx}" for word_idx in range(3)]
+            line_offset = offset
+            for word in line_words:
+                words.append(
+                    DocumentWord(
+                        content=word,
+                        span=DocumentSpan(offset=offset, length=len(word)),
+                        confidence=1.0,
+                    )
+                )
+                offset += len(word) + 1
+            line_content = " ".join(line_words)
+            lines.append(
+                DocumentLine(
+                    content=line_content,
+                    spans=[DocumentSpan(offset=line_offset, length=len(line_content))],
+                )
+            )
+            content_parts.append(line_content + "\n")
+        paragraphs.append(
+            DocumentParagraph(
+                content="\n".join(line.content for line in lines[:2]),
+                spans=[
+                    DocumentSpan(
+                        offset=lines[0].spans[0].offset,
+                        length=lines[1].spans[0].offset
+                        + lines[1].spans[0].length
+                        - lines[0].spans[0].offset,
+                    )
+                ],
+            )
+        )
+        key_words, value_words = words[6], words[7:9]
+        key_value_pairs.append(
+            DocumentKeyValuePair(
+                key=DocumentKeyValueElement(
+                    content=key_words.content, spans=[key_words.span]
+                ),
+                value=DocumentKeyValueElement(
+                    content=" ".join(word.content for word in value_words),
+                    spans=[
+                        DocumentSpan(
+                            offset=value_words[0].span.offset,
+                            length=value_words[-1].span.offset
+                            + value_words[-1].span.length
+                            - value_words[0].span.offset,
+                        )
+                    ],
+                ),
+                confidence=1.0,
+            )
+        )
+        pages.append(
+            DocumentPage(
+                page_number=page_number,
+                width=8.5,
+                height=11.0,
+                unit="inch",
+                spans=[DocumentSpan(offset=page_offset, length=offset - page_offset)],
+                lines=lines,
+                words=words,
+            )
+        )
+        # Pages are separated by a single character
+        content_parts.append("\n")
+        offset += 1
+    return AnalyzeResult(
+        api_version="2024-02-29-preview",
+        model_id="prebuilt-layout",
+        content="".join(content_parts),
+        pages=pages,
+        paragraphs=paragraphs,
+        key_value_pairs=key_value_pairs,
+        sections=[
+            DocumentSection(
+                spans=[DocumentSpan(offset=0, length=offset - 1)],
+                elements=[f"/paragraphs/{idx}" for idx in range(len(paragraphs))],
+            )
+        ],
+    )
+
+
+def _add_figure(analyze_result: AnalyzeResult, page_idx: int) -> AnalyzeResult:
+    """Adds a figure covering the paragraph of the given page."""
+    paragraph = analyze_result.paragraphs[page_idx]
+    analyze_result.figures = [
+        DocumentFigure(
+            spans=paragraph.spans,
+            bounding_regions=[
+                BoundingRegion(
+                    page_number=page_idx + 1, polygon=[1, 1, 2, 1, 2, 2, 1, 2]
+                )
+            ],
+        )
+    ]
+    return analyze_result
+
+
+class StaticFigureProcessor(DocumentFigureProcessor):
+    """Outputs a single document for each figure, or raises if `fail` is set."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    async def convert_figure(self, element_info, *args):
+        if self.fail:
+            raise RuntimeError("figure conversion failed")
+        return [self._make_doc(element_info, "figure", None)]
+
+
+def _process(
+    convert_pages_in_parallel: bool = False,
+    post_processor=None,
+    analyze_result=None,
+    on_error="raise",
+    **kwargs,
+):
+    analyze_result = analyze_result or _build_analyze_result()
+    doc_page_imgs = {
+        page.page_number: Image.new("RGB", (85, 110), "white")
+        for page in analyze_result.pages
+    }
+    post_processor = post_processor or DocumentIntelligenceResultPostProcessor()
+    return asyncio.run(
+        post_processor.process_analyze_result(
+            analyze_result,
+            doc_page_imgs=doc_page_imgs,
+            on_error=on_error,
+            convert_pages_in_parallel=convert_pages_in_parallel,
+            **kwargs,
+        )
+    )
+
+
+def _doc_values(docs):
+    return [(doc.id, doc.content, doc.meta) for doc in docs]
+
+
+def test_parallel_conversion_matches_serial_conversion():
+    serial_docs = _process(convert_pages_in_parallel=False)
+    parallel_docs = _process(convert_pages_in_parallel=True)
+    assert _doc_values(parallel_docs) == _doc_values(serial_docs)
+
+
+def test_parallel_conversion_reuses_a_given_pool():
+    post_processor = DocumentIntelligenceResultPostProcessor()
+    serial_docs = _process(False, post_processor)
+    pool = create_page_process_pool(
+        post_processor._paragraph_processor,
+        post_processor._line_processor,
+        post_processor._word_processor,
+        post_processor._key_value_pair_processor,
+        post_processor._selection_mark_formatter,
+        max_workers=2,
+    )
+    try:
+        for _ in range(2):
+            parallel_docs = _process(
+                True, post_processor, page_process_pool=pool
+            )
+            assert _doc_values(parallel_docs) == _doc_values(serial_docs)
+    finally:
+        pool.shutdown()
+
+
+def test_figure_content_is_skipped_when_the_figure_is_converted():
+    post_processor = DocumentIntelligenceResultPostProcessor(
+        figure_processor=StaticFigureProcessor()
+    )
+    docs = _process(
+        post_processor=post_processor,
+        analyze_result=_add_figure(_build_analyze_result(), page_idx=1),
+        on_error="ignore",
+    )
+    doc_ids = [doc.id for doc in docs]
+    assert "/figures/0" in doc_ids
+    assert "/paragraphs/1" not in doc_ids
+    assert "/paragraphs/0" in doc_ids
+
+
+@pytest.mark.parametrize("convert_pages_in_parallel", [False, True])
+def test_figure_content_is_kept_when_the_figure_fails(convert_pages_in_parallel):
+    post_processor = DocumentIntelligenceResultPostProcessor(
+        figure_processor=StaticFigureProcessor(fail=True)
+    )
+    docs = _process(
+        convert_pages_in_parallel,
+        post_processor=post_processor,
+        analyze_result=_add_figure(_build_analyze_result(), page_idx=1),
+        on_error="ignore",
+    )
+    # The figure's content is converted as if the figure did not exist
+    assert _doc_values(docs) == _doc_values(_process())
+
+
+def test_figure_error_is_raised_with_on_error_raise():
+    post_processor = DocumentIntelligenceResultPostProcessor(
+        figure_processor=StaticFigureProcessor(fail=True)
+    )
+    with pytest.raises(RuntimeError, match="figure conversion failed"):
+        _process(
+            post_processor=post_processor,
+            analyze_result=_add_figure(_build_analyze_result(), page_idx=1),
+        )
@@ -0,0 +1,92 @@
+import asyncio
+import random
+from typing import List
+
+import pytest
+
+from semanticChunk.contentSplit import (
+    CHUNK_MAX_SIZE,
+    CHUNK_MIN_SIZE,
+    SPIPPETS_SIZE,
+    mergeSpitsIntoChunk,
+)
+from semanticChunk.dataMode import MergedChunk, SplitResult
+
+
+def _reference_merge(splitResult: List[SplitResult]) -> List[MergedChunk]:
+    """
+    The merge as it was done before the prefix sums, walking the splits one
+    at a time. The final merge is only done when there is a previous chunk,
+    as the original loop failed on a single chunk below the minimum size.
+    """
+    mergedChunkList = []
+    index = 0
+    while index < len(splitResult):
+        currentSplit = splitResult[index]
+        if CHUNK_MIN_SIZE <= currentSplit.tokens:
+            mergedChunkList.append(
+                MergedChunk(splits=currentSplit.content, totalTokens=currentSplit.tokens, note="it is bigger than chunk min size,keep as is")
+            )
+            index += 1
+        else:
+            combinedTokens = currentSplit.tokens
+            combinedContent = currentSplit.content
+            index += 1
+            while combinedTokens < CHUNK_MAX_SIZE and index < len(splitResult):
+                currentSplit = splitResult[index]
+                combinedTokens += currentSplit.tokens
+                if combinedTokens < CHUNK_MAX_SIZE or currentSplit.tokens < SPIPPETS_SIZE or ((combinedTokens - currentSplit.tokens) < SPIPPETS_SIZE):
+                    combinedContent += "\n" + currentSplit.content
+                    index += 1
+                else:
+                    combinedTokens -= currentSplit.tokens
+                    break
+            mergedChunkList.append(
+                MergedChunk(splits=combinedContent, totalTokens=combinedTokens, note="it is bigger than chunk min size,keep as is")
+            )
+    if len(mergedChunkList) > 1 and mergedChunkList[-1].totalTokens < CHUNK_MIN_SIZE:
+        lastMergedChunk = mergedChunkList.pop()
+        mergedChunkList[-1].splits += lastMergedChunk.splits
+        mergedChunkList[-1].totalTokens += lastMergedChunk.totalTokens
+    return mergedChunkList
+
+
+def _random_splits(rng: random.Random) -> List[SplitResult]:
+    # Mix splits around the snippet, minimum and maximum sizes
+    token_ranges = [
+        (0, SPIPPETS_SIZE),
+        (SPIPPETS_SIZE, CHUNK_MIN_SIZE),
+        (CHUNK_MIN_SIZE, CHUNK_MAX_SIZE),
+        (CHUNK_MAX_SIZE, 2 * CHUNK_MAX_SIZE),
+    ]
+    return [
+        SplitResult(tokens=rng.randint(*rng.choice(token_ranges)), content=f"split {idx}")
+        for idx in range(rng.randint(1, 40))
+    ]
+
+
+def test_merge_splits_matches_reference():
+    rng = random.Random(0)
+    for _ in range(1000):
+        splits = _random_splits(rng)
+        assert asyncio.run(mergeSpitsIntoChunk(splits)) == _reference_merge(splits)
+
+
+@pytest.mark.parametrize(
+    "tokens",
+    [
+        [CHUNK_MIN_SIZE],
+        [CHUNK_MIN_SIZE - 1],
+        [SPIPPETS_SIZE - 1] * 10,
+        [CHUNK_MAX_SIZE - 1, 1, CHUNK_MIN_SIZE],
+        [SPIPPETS_SIZE - 1, CHUNK_MAX_SIZE, SPIPPETS_SIZE],
+        [SPIPPETS_SIZE, CHUNK_MAX_SIZE - SPIPPETS_SIZE, SPIPPETS_SIZE],
+        [CHUNK_MIN_SIZE, SPIPPETS_SIZE - 1],
+    ],
+)
+def test_merge_splits_size_boundaries(tokens):
+    splits = [
+        SplitResult(tokens=split_tokens, content=f"split {idx}")
+        for idx, split_tokens in enumerate(tokens)
+    ]
+    assert asyncio.run(mergeSpitsIntoChunk(splits)) == _reference_merge(splits)
@@ -0,0 +1,186 @@
+import pickle
+import random
+
+import pytest
+from azure.ai.documentintelligence.models import (
+    DocumentBarcode,
+    DocumentFormula,
+    DocumentSpan,
+)
+
+from docProcess.elementProcess.elementTools import (
+    SortedSpanIndex,
+    compile_text_format,
+    get_barcodes_in_spans,
+    get_formulas_in_spans,
+    replace_content_formulas_and_barcodes,
+)
+
+
+def _render(render, text_format: str, **kwargs):
+    """
+    Renders a format, returning either the output or the type of the raised
+    exception so that both can be compared.
+    """
+    try:
+        return render(text_format, **kwargs)
+    except Exception as e:
+        return type(e)
+
+
+def _assert_matches_str_format(text_format: str, **kwargs):
+    expected = _render(lambda fmt, **kw: fmt.format(**kw), text_format, **kwargs)
+    actual = _render(lambda fmt, **kw: compile_text_format(fmt)(**kw), text_format, **kwargs)
+    assert actual == expected
+
+
+TEXT_FORMATS = [
+    "",
+    "{content}",
+    "{content}\n",
+    "*Page {page_number} content:*\n{content}",
+    "{title}: {content} ({title})",
+    "no placeholders",
+    "{{content}}",
+    "{{{content}}}",
+    "{{ {content} }} and {{}}",
+    "}}{{",
+    "{content!r}",
+    "{content:>10}",
+    "{page_number:03d}",
+    "{content[0]}",
+    "{0}",
+    "{}",
+]
+
+
+@pytest.mark.parametrize("text_format", TEXT_FORMATS)
+def test_compiled_text_format_matches_str_format(text_format):
+    for kwargs in (
+        {"content": "some text", "title": "Title", "page_number": 3},
+        {"content": "", "title": "", "page_number": 0},
+        {"content": "a {b} }}", "title": "{x}", "page_number": 12},
+    ):
+        _assert_matches_str_format(text_format, **kwargs)
+
+
+@pytest.mark.parametrize("text_format", TEXT_FORMATS)
+def test_compiled_text_format_missing_keys_match_str_format(text_format):
+    _assert_matches_str_format(text_format)
+    _assert_matches_str_format(text_format, title="Title")
+
+
+@pytest.mark.parametrize(
+    "text_format", ["{content}", "{title}: {content}", "{content!r}"]
+)
+def test_compiled_text_format_missing_key_raises_key_error(text_format):
+    with pytest.raises(KeyError):
+        text_format.format(title="Title")
+    with pytest.raises(KeyError):
+        compile_text_format(text_format)(title="Title")
+
+
+def test_compiled_text_format_non_string_values():
+    for text_format in ("{content}", "{title}: {content}"):
+        _assert_matches_str_format(text_format, content=12, title=None)
+        _assert_matches_str_format(text_format, content=1.5, title=["a"])
+
+
+def test_compiled_text_format_field_names():
+    assert compile_text_format("{title}: {content}").field_names == {"title", "content"}
+    assert compile_text_format("{{content}}").field_names == frozenset()
+    assert compile_text_format("{content:>10}").field_names is None
+
+
+@pytest.mark.parametrize("text_format", TEXT_FORMATS)
+def test_compiled_text_format_pickles(text_format):
+    formatter = pickle.loads(pickle.dumps(compile_text_format(text_format)))
+    assert formatter.text_format == text_format
+    assert _render(
+        lambda fmt, **kw: formatter(**kw), text_format, content="text", title="T"
+    ) == _render(lambda fmt, **kw: fmt.format(**kw), text_format, content="text", title="T")
+
+
+def _random_span_elements(rng: random.Random):
+    """
+    Builds formulas and barcodes in document order, along with spans that
+    cover, partially overlap or fall between them.
+    """
+    formulas = list()
+    barcodes = list()
+    offset = 0
+    for idx in range(rng.randint(0, 40)):
+        offset += rng.randint(0, 5)
+        span = DocumentSpan(offset=offset, length=rng.randint(1, 8))
+        if rng.random() < 0.5:
+            formulas.append(
+                DocumentFormula(kind="inline", value=f"x_{idx}", span=span, confidence=1.0)
+            )
+        else:
+            barcodes.append(
+                DocumentBarcode(kind="QRCode", value=f"code{idx}", span=span, confidence=1.0)
+            )
+        offset += span.length
+    spans = [
+        DocumentSpan(offset=rng.randint(0, offset + 5), length=rng.randint(0, 30))
+        for _ in range(rng.randint(1, 4))
+    ]
+    return formulas, barcodes, spans
+
+
+def test_sorted_span_index_matches_linear_scan():
+    rng = random.Random(0)
+    for _ in range(500):
+        formulas, barcodes, spans = _random_span_elements(rng)
+        span_index = SortedSpanIndex(formulas, barcodes)
+        assert span_index.get_formulas_in_spans(spans) == get_formulas_in_spans(
+            formulas, spans
+        )
+        assert span_index.get_barcodes_in_spans(spans) == get_barcodes_in_spans(
+            barcodes, spans
+        )
+
+
+def test_sorted_span_index_span_boundaries():
+    formulas = [
+        DocumentFormula(kind="inline", value="a", span=DocumentSpan(offset=10, length=5), confidence=1.0),
+        DocumentFormula(kind="inline", value="b", span=DocumentSpan(offset=15, length=0), confidence=1.0),
+        DocumentFormula(kind="inline", value="c", span=DocumentSpan(offset=15, length=1), confidence=1.0),
+    ]
+    span_index = SortedSpanIndex(formulas, [])
+    for span in (
+        DocumentSpan(offset=10, length=5),
+        DocumentSpan(offset=11, length=5),
+        DocumentSpan(offset=10, length=4),
+        DocumentSpan(offset=15, length=0),
+        DocumentSpan(offset=0, length=100),
+    ):
+        assert span_index.get_formulas_in_spans([span]) == get_formulas_in_spans(
+            formulas, [span]
+        )
+
+
+def test_replace_content_formulas_and_barcodes_with_span_index():
+    formulas = [
+        DocumentFormula(kind="inline", value=r"\alpha", span=DocumentSpan(offset=6, length=9), confidence=1.0),
+        DocumentFormula(kind="inline", value="x^2", span=DocumentSpan(offset=40, length=9), confidence=1.0),
+    ]
+    barcodes = [
+        DocumentBarcode(kind="QRCode", value="123", span=DocumentSpan(offset=20, length=9), confidence=1.0),
+    ]
+    content = "Value :formula: and :barcode:"
+    content_spans = [DocumentSpan(offset=0, length=30)]
+    expected = replace_content_formulas_and_barcodes(
+        content, content_spans, formulas, barcodes
+    )
+    assert expected == "Value α and *Barcode value:* 123 (*Barcode kind:* QRCode)"
+    assert (
+        replace_content_formulas_and_barcodes(
+            content,
+            content_spans,
+            formulas,
+            barcodes,
+            span_index=SortedSpanIndex(formulas, barcodes),
+        )
+        == expected
+    )
@@ -0,0 +1,126 @@
+import asyncio
+import random
+from typing import Dict
+
+import pytest
+from azure.ai.documentintelligence.models import (
+    AnalyzeResult,
+    DocumentPage,
+    DocumentSpan,
+    DocumentWord,
+)
+
+from docProcess.elementProcess.elementInfo import SpanBounds
+from docProcess.elementProcess.pageProcessor import PageSpanCalculator
+
+
+def _reference_page_span_bounds(analyze_result: AnalyzeResult) -> Dict[int, SpanBounds]:
+    """
+    The page span bounds as they were calculated before the bounds were kept
+    in arrays.
+    """
+    page_span_bounds = dict()
+    page_start_span = 0
+    for page in analyze_result.pages:
+        max_page_bound = max(span.offset + span.length for span in page.spans)
+        max_word_bound = (
+            page.words[-1].span.offset + page.words[-1].span.length
+            if page.words
+            else -1
+        )
+        max_bound_across_elements = max(max_page_bound, max_word_bound)
+        page_span_bounds[page.page_number] = SpanBounds(
+            offset=page_start_span, end=max_bound_across_elements
+        )
+        page_start_span = max_bound_across_elements + 1
+    return page_span_bounds
+
+
+def _reference_span_start_page(
+    page_span_bounds: Dict[int, SpanBounds], span_start_offset: int
+) -> int:
+    """
+    The page lookup as it was done before the bounds were kept in arrays, by
+    scanning every page's bounds.
+    """
+    return min(
+        page_num
+        for page_num, bounds in page_span_bounds.items()
+        if bounds.offset <= span_start_offset and bounds.end >= span_start_offset
+    )
+
+
+def _random_analyze_result(rng: random.Random) -> AnalyzeResult:
+    """
+    Builds a result with contiguous pages, where a page's last word may end
+    after the page's own spans.
+    """
+    pages = list()
+    offset = 0
+    for page_number in range(1, rng.randint(1, 30) + 1):
+        span = DocumentSpan(offset=offset, length=rng.randint(1, 50))
+        page_end = span.offset + span.length
+        words = list()
+        if rng.random() < 0.7:
+            word_offset = rng.randint(span.offset, page_end)
+            word_length = rng.randint(0, 10)
+            words.append(
+                DocumentWord(
+                    content="w" * word_length,
+                    span=DocumentSpan(offset=word_offset, length=word_length),
+                    confidence=1.0,
+                )
+            )
+            page_end = max(page_end, word_offset + word_length)
+        pages.append(
+            DocumentPage(page_number=page_number, spans=[span], words=words)
+        )
+        offset = page_end + 1
+    return AnalyzeResult(pages=pages)
+
+
+def test_page_span_bounds_match_reference():
+    rng = random.Random(0)
+    for _ in range(200):
+        analyze_result = _random_analyze_result(rng)
+        assert PageSpanCalculator(
+            analyze_result
+        ).page_span_bounds == _reference_page_span_bounds(analyze_result)
+
+
+def test_determine_span_start_pages_match_reference():
+    rng = random.Random(1)
+    for _ in range(200):
+        analyze_result = _random_analyze_result(rng)
+        reference_bounds = _reference_page_span_bounds(analyze_result)
+        doc_end_span = max(bounds.end for bounds in reference_bounds.values())
+        # Every offset in the document, including each page's first and last
+        offsets = list(range(doc_end_span + 1))
+        rng.shuffle(offsets)
+        calculator = PageSpanCalculator(analyze_result)
+        expected = [
+            _reference_span_start_page(reference_bounds, offset) for offset in offsets
+        ]
+        assert calculator.determine_span_start_pages(offsets).tolist() == expected
+        for offset in offsets[:10]:
+            assert asyncio.run(
+                calculator.determine_span_start_page(offset)
+            ) == _reference_span_start_page(reference_bounds, offset)
+
+
+def test_determine_span_start_pages_empty():
+    calculator = PageSpanCalculator(_random_analyze_result(random.Random(2)))
+    assert calculator.determine_span_start_pages([]).tolist() == []
+
+
+def test_determine_span_start_pages_past_document_end_raises():
+    analyze_result = _random_analyze_result(random.Random(3))
+    calculator = PageSpanCalculator(analyze_result)
+    doc_end_span = max(
+        bounds.end for bounds in _reference_page_span_bounds(analyze_result).values()
+    )
+    calculator.determine_span_start_pages([doc_end_span])
+    with pytest.raises(ValueError):
+        calculator.determine_span_start_pages([0, doc_end_span + 1])
+    with pytest.raises(ValueError):
+        asyncio.run(calculator.determine_span_start_page(doc_end_span + 1))
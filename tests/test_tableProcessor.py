@@ -0,0 +1,161 @@
+from typing import List, Optional
+
+import pandas as pd
+import pytest
+from azure.ai.documentintelligence.models import (
+    DocumentSpan,
+    DocumentTable,
+    DocumentTableCell,
+)
+
+from docProcess.elementProcess.selectionMarkFormatter import (
+    DefaultSelectionMarkFormatter,
+)
+from docProcess.elementProcess.tableProcessor import (
+    DefaultDocumentTableProcessor,
+    render_github_markdown_table,
+)
+
+
+def _build_table(
+    rows: List[List[str]],
+    num_header_rows: int = 0,
+    num_index_cols: int = 0,
+    merged_cells: Optional[dict] = None,
+) -> DocumentTable:
+    """
+    Builds a table from a grid of cell text. `merged_cells` maps the (row,
+    column) of a cell to its (row_span, column_span); the cells it covers are
+    left out of the table, as Document Intelligence does.
+    """
+    merged_cells = merged_cells or dict()
+    covered = set()
+    for (row_idx, col_idx), (row_span, col_span) in merged_cells.items():
+        covered.update(
+            (row_idx + row_offset, col_idx + col_offset)
+            for row_offset in range(row_span)
+            for col_offset in range(col_span)
+            if row_offset or col_offset
+        )
+    cells = list()
+    for row_idx, row in enumerate(rows):
+        for col_idx, content in enumerate(row):
+            if (row_idx, col_idx) in covered:
+                continue
+            if row_idx < num_header_rows:
+                kind = "columnHeader"
+            elif col_idx < num_index_cols:
+                kind = "rowHeader"
+            else:
+                kind = "content"
+            row_span, col_span = merged_cells.get((row_idx, col_idx), (1, 1))
+            cells.append(
+                DocumentTableCell(
+                    kind=kind,
+                    row_index=row_idx,
+                    column_index=col_idx,
+                    row_span=row_span,
+                    column_span=col_span,
+                    content=content,
+                    spans=[DocumentSpan(offset=0, length=len(content))],
+                )
+            )
+    return DocumentTable(
+        row_count=len(rows), column_count=len(rows[0]), cells=cells, spans=[]
+    )
+
+
+def _convert(table: DocumentTable):
+    table_md, table_df, _ = DefaultDocumentTableProcessor()._convert_table_content(
+        table, [], [], DefaultSelectionMarkFormatter()
+    )
+    return table_md.strip("\n"), table_df
+
+
+@pytest.mark.parametrize(
+    "rows, num_header_rows, num_index_cols, merged_cells",
+    [
+        # A single header row
+        ([["Name", "Qty"], ["apple", "a few"], ["kiwi", "many"]], 1, 0, None),
+        # Multiple header rows, rendered as tuple labels
+        (
+            [["Fruit", "Fruit", "Stock"], ["Name", "Colour", "Qty"], ["fig", "purple", "some"]],
+            2,
+            0,
+            None,
+        ),
+        # Header rows and an index column
+        ([["", "Jan", "Feb"], ["North", "up", "down"], ["South", "flat", "up"]], 1, 1, None),
+        # Header rows and multiple index columns
+        (
+            [["", "", "Total"], ["EU", "FR", "high"], ["EU", "DE", "low"]],
+            1,
+            2,
+            None,
+        ),
+        # Merged header and body cells
+        (
+            [["Region", "Sales", "Sales"], ["North", "high", "high"], ["North", "low", "mid"]],
+            1,
+            0,
+            {(0, 1): (1, 2), (1, 0): (2, 1), (1, 1): (1, 2)},
+        ),
+        # Cells wider than their headers, and empty cells
+        ([["A", "B"], ["a much longer value", ""], ["", "x"]], 1, 0, None),
+    ],
+)
+def test_markdown_matches_to_markdown_with_headers(
+    rows, num_header_rows, num_index_cols, merged_cells
+):
+    table_md, table_df = _convert(
+        _build_table(rows, num_header_rows, num_index_cols, merged_cells)
+    )
+    assert table_md == table_df.to_markdown(
+        index=num_index_cols > 0, tablefmt="github"
+    )
+
+
+@pytest.mark.parametrize("num_index_cols", [0, 1, 2])
+def test_markdown_without_headers_matches_previous_rendering(num_index_cols):
+    rows = [["North", "East", "up"], ["South", "West", "a longer value"]]
+    table_md, _ = _convert(_build_table(rows, num_index_cols=num_index_cols))
+    # The previous rendering named the index after its column numbers and used
+    # a dummy header row
+    previous_df = pd.DataFrame(rows)
+    if num_index_cols > 0:
+        previous_df = previous_df.set_index(list(range(num_index_cols)))
+    previous_df.columns = ["<!-- -->"] * previous_df.shape[1]
+    assert table_md == previous_df.to_markdown(
+        index=num_index_cols > 0, tablefmt="github"
+    )
+    if num_index_cols == 1:
+        assert table_md.startswith("| 0 ")
+
+
+def test_multiline_cells_fall_back_to_to_markdown():
+    rows = [["North", "first line\nsecond line"], ["South", "up"]]
+    table_md, table_df = _convert(_build_table(rows, num_index_cols=1))
+    assert table_md == table_df.to_markdown(
+        index=True, tablefmt="github", headers=["0", "<!-- -->"]
+    )
+
+
+def test_numeric_cells_are_kept_as_extracted():
+    rows = [["Item", "Price"], ["tea", "1.50"], ["cake", "12"]]
+    table_md, table_df = _convert(_build_table(rows, num_header_rows=1))
+    # tabulate reformats and right-aligns numbers, which the direct renderer
+    # does not do. With number parsing disabled the outputs match.
+    assert "1.50" in table_md
+    assert "1.50" not in table_df.to_markdown(index=False, tablefmt="github")
+    assert table_md == table_df.to_markdown(
+        index=False, tablefmt="github", disable_numparse=True
+    )
+
+
+def test_render_github_markdown_table_from_grid():
+    table_md = render_github_markdown_table(
+        pd.DataFrame([["A", "B"], ["x", "yy"]]).to_numpy(dtype=object), 1, 0
+    )
+    assert table_md == "\n".join(
+        ["| A   | B   |", "|-----|-----|", "| x   | yy  |"]
+    )